@@ -0,0 +1,384 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, List, Tuple
+
+import httpx
+
+from asa.asana.client import (
+    ASANA_API_BASE,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+    PAGE_SIZE,
+    PROJECT_OPT_FIELDS,
+    TASK_OPT_FIELDS,
+    TEAM_OPT_FIELDS,
+    Params,
+    SyncTokenExpiredError,
+    search_params,
+)
+from asa.asana.retry import RetryPolicy, RetryStats, RateLimiter
+from asa.asana.model import (
+    BaseModel,
+    Event,
+    Page,
+    Project,
+    Section,
+    Task,
+    TaskList,
+    Team,
+    TeamMembership,
+    User,
+    WorkspaceMembership,
+    IdentityMap,
+)
+
+# Default maximum number of requests in flight at once from a single AsyncAsanaClient
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class AsyncAsanaClient:
+    """
+    asyncio counterpart to AsanaClient: exposes the same methods as coroutines (and the iter_*
+    methods as async iterators), returning the same asa.asana.model types.
+
+    Use as an async context manager, or call aclose() when done, so that the underlying connection
+    pool is released:
+
+        async with AsyncAsanaClient(token) as asana:
+            tasks = await asana.get_project_incomplete_tasks(project_id=...)
+    """
+
+    def __init__(
+        self,
+        token: str,
+        verbose: bool = False,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        intern_refs: bool = False,
+    ):
+        """
+        :param token: Asana personal access token.
+        :param verbose: Whether to print details of requests and responses.
+        :param http_client: HTTP client to send requests through; by default the client creates
+            (and owns) its own connection pool.
+        :param pool_size: Number of keep-alive connections held open when creating the pool.
+        :param max_concurrency: Maximum number of requests in flight at once.
+        :param timeout: (connect, read) timeouts in seconds.
+        :param retry_policy: Policy for retrying throttled and failed requests; its retry budget
+            is shared by all requests made by the client.
+        :param rate_limiter: Rate limiter to hold requests back with; disabled if None.
+        :param intern_refs: Whether to intern the resources that decoded models refer to in an
+            identity map (identity_map) for the life of the client, as with AsanaClient.
+        """
+        self.token = token
+        self.verbose = verbose
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.identity_map = IdentityMap() if intern_refs else None
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        return self.retry_policy.stats
+
+    def _intern[T](self, value: T) -> T:
+        return self.identity_map.intern(value) if self.identity_map is not None else value
+
+    async def __aenter__(self) -> "AsyncAsanaClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def _send_request_raw(
+        self, path: str, *, params: Params | None = None, method: str = "get"
+    ) -> bytes:
+        """
+        Sends a request to the Asana API and returns the raw response body.
+        """
+        attempt = 0
+
+        while True:
+            if self.rate_limiter and (delay := self.rate_limiter.reserve()) > 0:
+                self.retry_policy.record_rate_limited(delay)
+                await asyncio.sleep(delay)
+
+            attempt += 1
+            try:
+                async with self._semaphore:
+                    resp = await self.http_client.request(
+                        method,
+                        f"{ASANA_API_BASE}{path}",
+                        params=params,
+                        headers={"Authorization": f"Bearer {self.token}"},
+                    )
+            except httpx.TransportError:
+                if (retry_delay := self.retry_policy.next_delay(attempt, status_code=None)) is None:
+                    raise
+            else:
+                if self.verbose:
+                    print("----------------------------")
+                    print(f"URL:              {resp.request.method} {resp.url}")
+                    print(f"Status:           {resp.status_code} {resp.reason_phrase}")
+                    print(f"Request headers:  {json.dumps(dict(resp.request.headers))}")
+                    print(f"Response headers: {json.dumps(dict(resp.headers))}")
+                    print("----------------------------")
+                    print("Response body:")
+                    print(resp.text)
+                    print("----------------------------")
+
+                if resp.is_success:
+                    return resp.content
+
+                retry_delay = self.retry_policy.next_delay(
+                    attempt,
+                    status_code=resp.status_code,
+                    retry_after=resp.headers.get("Retry-After"),
+                )
+                if retry_delay is None:
+                    resp.raise_for_status()
+                    return resp.content
+
+            if self.verbose:
+                print(f"Retrying in {retry_delay:.2f}s: {method.upper()} {path} {params or ''}")
+            await asyncio.sleep(retry_delay)
+
+    async def _send_request(
+        self, path: str, *, params: Params | None = None, method: str = "get"
+    ) -> Any:
+        """
+        Sends a request to the Asana API and returns the decoded response body (i.e. including the
+        "data" envelope and, for paginated endpoints, "next_page").
+        """
+        return json.loads(await self._send_request_raw(path, params=params, method=method))
+
+    async def _iter_pages[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None
+    ) -> AsyncIterator[List[M]]:
+        page_model = Page[model]  # type: ignore[valid-type]
+        params_: Params = {**(params or {}), "limit": PAGE_SIZE}
+
+        while True:
+            page = self._intern(
+                page_model.model_validate_json(await self._send_request_raw(path, params=params_))
+            )
+            yield page.data
+
+            if not page.next_page:
+                return
+
+            params_ = {**params_, "offset": page.next_page.offset}
+
+    async def _iter_models[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None
+    ) -> AsyncIterator[M]:
+        async for page in self._iter_pages(model, path, params=params):
+            for item in page:
+                yield item
+
+    # https://developers.asana.com/reference/getuser
+    async def get_user(self, *, user_id: str) -> User:
+        data = (await self._send_request(f"/users/{user_id}"))["data"]
+        return self._intern(User.model_validate(data))
+
+    # https://developers.asana.com/reference/getworkspacemembershipsforuser
+    def iter_workspace_memberships(
+        self, *, user_id: str = "me"
+    ) -> AsyncIterator[WorkspaceMembership]:
+        return self._iter_models(WorkspaceMembership, f"/users/{user_id}/workspace_memberships")
+
+    async def get_workspace_memberships(self, *, user_id: str = "me") -> List[WorkspaceMembership]:
+        return [wm async for wm in self.iter_workspace_memberships(user_id=user_id)]
+
+    # https://developers.asana.com/reference/getteamsforuser
+    def iter_teams(self, *, workspace: str, user_id: str = "me") -> AsyncIterator[Team]:
+        return self._iter_models(
+            Team,
+            f"/users/{user_id}/teams",
+            params={"workspace": workspace, "opt_fields": TEAM_OPT_FIELDS},
+        )
+
+    async def get_teams(self, *, workspace: str, user_id: str = "me") -> List[Team]:
+        return [t async for t in self.iter_teams(workspace=workspace, user_id=user_id)]
+
+    # https://developers.asana.com/reference/getteammembershipsforteam
+    def iter_team_members(self, *, team_id: str) -> AsyncIterator[TeamMembership]:
+        return self._iter_models(TeamMembership, f"/teams/{team_id}/team_memberships")
+
+    async def get_team_members(self, *, team_id: str) -> List[TeamMembership]:
+        return [tm async for tm in self.iter_team_members(team_id=team_id)]
+
+    # https://developers.asana.com/reference/getprojectsforteam
+    def iter_projects_by_team(self, *, team_id: str) -> AsyncIterator[Project]:
+        return self._iter_models(
+            Project, f"/teams/{team_id}/projects", params={"opt_fields": PROJECT_OPT_FIELDS}
+        )
+
+    async def get_projects_by_team(self, *, team_id: str) -> List[Project]:
+        return [p async for p in self.iter_projects_by_team(team_id=team_id)]
+
+    # https://developers.asana.com/reference/gettasksforproject
+    def iter_project_incomplete_tasks(
+        self, *, project_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> AsyncIterator[Task]:
+        return self._iter_models(
+            Task,
+            f"/projects/{project_id}/tasks",
+            params={"completed_since": "now", "opt_fields": opt_fields},
+        )
+
+    async def get_project_incomplete_tasks(
+        self, *, project_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> List[Task]:
+        return [
+            t
+            async for t in self.iter_project_incomplete_tasks(
+                project_id=project_id, opt_fields=opt_fields
+            )
+        ]
+
+    # https://developers.asana.com/reference/gettasksforsection
+    def iter_section_incomplete_tasks(
+        self, *, section_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> AsyncIterator[Task]:
+        return self._iter_models(
+            Task,
+            f"/sections/{section_id}/tasks",
+            params={"completed_since": "now", "opt_fields": opt_fields},
+        )
+
+    async def get_section_incomplete_tasks(
+        self, *, section_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> List[Task]:
+        return [
+            t
+            async for t in self.iter_section_incomplete_tasks(
+                section_id=section_id, opt_fields=opt_fields
+            )
+        ]
+
+    # https://developers.asana.com/reference/gettask
+    async def get_task(
+        self, *, task_id: str, opt_fields: str = f"{TASK_OPT_FIELDS},completed"
+    ) -> Task:
+        body = await self._send_request(f"/tasks/{task_id}", params={"opt_fields": opt_fields})
+        return self._intern(Task.model_validate(body["data"]))
+
+    # https://developers.asana.com/reference/getevents
+    async def get_events(self, *, resource_id: str, sync: str | None) -> Tuple[List[Event], str]:
+        """
+        Returns the events on the resource since the sync token was issued, along with the token
+        to use for the next call.
+
+        :raises SyncTokenExpiredError: If no sync token is given or it has expired.
+        """
+        events: List[Event] = []
+
+        while True:
+            params: Params = {"resource": resource_id, **({"sync": sync} if sync else {})}
+            try:
+                body = await self._send_request("/events", params=params)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 412:
+                    raise SyncTokenExpiredError(e.response.json()["sync"]) from e
+                raise
+
+            events.extend(Event.model_validate(e) for e in body["data"])
+            sync = body["sync"]
+
+            if not body.get("has_more"):
+                return events, sync
+
+    # https://developers.asana.com/reference/getusertasklistforuser
+    async def get_user_task_list(self, *, workspace: str, user_id: str = "me") -> TaskList:
+        data = (
+            await self._send_request(
+                f"/users/{user_id}/user_task_list", params={"workspace": workspace}
+            )
+        )["data"]
+        return self._intern(TaskList.model_validate(data))
+
+    # https://developers.asana.com/reference/gettasksforusertasklist
+    def iter_user_incomplete_tasks(
+        self, *, task_list_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> AsyncIterator[Task]:
+        return self._iter_models(
+            Task,
+            f"/user_task_lists/{task_list_id}/tasks",
+            params={"completed_since": "now", "opt_fields": opt_fields},
+        )
+
+    async def get_user_incomplete_tasks(
+        self, *, task_list_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> List[Task]:
+        return [
+            t
+            async for t in self.iter_user_incomplete_tasks(
+                task_list_id=task_list_id, opt_fields=opt_fields
+            )
+        ]
+
+    # https://developers.asana.com/reference/getsectionsforproject
+    def iter_sections_by_project(self, *, project_id: str) -> AsyncIterator[Section]:
+        return self._iter_models(Section, f"/projects/{project_id}/sections")
+
+    async def get_sections_by_project(self, *, project_id: str) -> List[Section]:
+        return [s async for s in self.iter_sections_by_project(project_id=project_id)]
+
+    # https://developers.asana.com/reference/searchtasksforworkspace
+    async def iter_search_tasks(
+        self,
+        *,
+        workspace_id: str,
+        project_id: str,
+        search_text: str,
+        opt_fields: str = TASK_OPT_FIELDS,
+    ) -> AsyncIterator[Task]:
+        params = search_params(
+            project_id=project_id, search_text=search_text, opt_fields=opt_fields
+        )
+
+        while True:
+            body = await self._send_request_raw(
+                f"/workspaces/{workspace_id}/tasks/search", params=params
+            )
+            page = self._intern(Page[Task].model_validate_json(body)).data
+            for item in page:
+                yield item
+
+            if len(page) < PAGE_SIZE or not (created_at := page[-1].created_at):
+                return
+
+            params = {**params, "created_at.before": created_at}
+
+    async def search_tasks(
+        self,
+        *,
+        workspace_id: str,
+        project_id: str,
+        search_text: str,
+        opt_fields: str = TASK_OPT_FIELDS,
+    ) -> List[Task]:
+        return [
+            t
+            async for t in self.iter_search_tasks(
+                workspace_id=workspace_id,
+                project_id=project_id,
+                search_text=search_text,
+                opt_fields=opt_fields,
+            )
+        ]
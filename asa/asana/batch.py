@@ -0,0 +1,268 @@
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, TypeVar
+
+from asa.asana.client import (
+    PAGE_SIZE,
+    PROJECT_OPT_FIELDS,
+    TASK_OPT_FIELDS,
+    TEAM_OPT_FIELDS,
+    Params,
+)
+from asa.asana.model import (
+    BaseModel,
+    Data,
+    Page,
+    Project,
+    Section,
+    Task,
+    TaskList,
+    Team,
+    TeamMembership,
+    User,
+)
+
+if TYPE_CHECKING:
+    from asa.asana.client import AsanaClient
+
+# Maximum number of actions in a single request to the Batch API
+# See: https://developers.asana.com/reference/createbatchrequest
+MAX_BATCH_ACTIONS = 10
+
+T = TypeVar("T")
+
+
+class BatchActionError(Exception):
+    """
+    Raised (when its result is read) for an action in a batch that failed.
+    """
+
+    def __init__(self, *, path: str, status_code: int, body: Any):
+        errors = body.get("errors") if isinstance(body, dict) else None
+        message = "; ".join(e.get("message", "") for e in errors or []) or "Request failed"
+        super().__init__(f"{status_code} {message}: GET {path}")
+        self.path = path
+        self.status_code = status_code
+        self.body = body
+
+
+class BatchResult(Generic[T]):
+    """
+    The result of an action in a batch, available once the batch has been sent.
+    """
+
+    def __init__(self) -> None:
+        self._done = False
+        self._value: T | None = None
+        self._error: Exception | None = None
+
+    def _set(self, value: T) -> None:
+        self._done, self._value = True, value
+
+    def _fail(self, error: Exception) -> None:
+        self._done, self._error = True, error
+
+    def result(self) -> T:
+        """
+        :raises BatchActionError: If the action failed.
+        """
+        if not self._done:
+            raise RuntimeError("The batch has not been sent yet")
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore[return-value]
+
+
+class _Action:
+    def __init__(
+        self,
+        path: str,
+        params: Params,
+        decode: Callable[[Any], Any],
+        result: BatchResult,
+        refresh: bool,
+    ):
+        self.path = path
+        self.params = params
+        self.decode = decode
+        self.result = result
+        self.refresh = refresh
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Converts the action to its Batch API form, in which opt_fields, limit and offset are given
+        as options and any other query parameters as data.
+        """
+        options: Dict[str, Any] = {}
+        data: Dict[str, Any] = {}
+        for name, value in self.params.items():
+            if name == "opt_fields":
+                options["fields"] = str(value).split(",")
+            elif name in ("limit", "offset"):
+                options[name] = value
+            else:
+                data[name] = value
+
+        return {
+            "relative_path": self.path,
+            "method": "get",
+            **({"data": data} if data else {}),
+            **({"options": options} if options else {}),
+        }
+
+
+class Batch:
+    """
+    Queues independent GET requests so that they can be sent together, up to MAX_BATCH_ACTIONS
+    to a request, via the Batch API. Each method returns a BatchResult that holds the same model(s)
+    as the AsanaClient method of the same name once the batch has been sent - which happens on
+    leaving the `with` block:
+
+        with asana.batch() as batch:
+            task_list = batch.get_user_task_list(workspace=...)
+            user = batch.get_user(user_id="me")
+
+        print(user.result().name)
+
+    Cached responses are used as usual, unless refresh is passed (and batched responses cached).
+    For list endpoints, any pages after the first are fetched by AsanaClient as usual.
+
+    See: https://developers.asana.com/reference/batch-api
+    """
+
+    def __init__(self, client: "AsanaClient"):
+        self.client = client
+        self._actions: List[_Action] = []
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.send()
+
+    def _queue(
+        self, path: str, params: Params, decode: Callable[[Any], T], *, refresh: bool = False
+    ) -> BatchResult[T]:
+        result: BatchResult[T] = BatchResult()
+        self._actions.append(_Action(path, params, decode, result, refresh))
+        return result
+
+    def get[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None
+    ) -> BatchResult[M]:
+        """
+        Queues a request for a single resource.
+        """
+        data_model = Data[model]  # type: ignore[valid-type]
+        return self._queue(
+            path,
+            params or {},
+            lambda body: self.client._intern(data_model.model_validate(body).data),
+        )
+
+    def get_all[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None, refresh: bool = False
+    ) -> BatchResult[List[M]]:
+        """
+        Queues a request for all the items from a paginated endpoint.
+
+        :param refresh: Whether to ignore any cached response (see AsanaClient._get_cached).
+        """
+        page_model = Page[model]  # type: ignore[valid-type]
+        params_: Params = {**(params or {}), "limit": PAGE_SIZE}
+
+        def _decode(body: Any) -> List[M]:
+            page = self.client._intern(page_model.model_validate(body))
+            if not page.next_page:
+                return page.data
+
+            rest = self.client._iter_pages(
+                model,
+                path,
+                params={**(params or {}), "offset": page.next_page.offset},
+                refresh=refresh,
+            )
+            return [*page.data, *(item for items in rest for item in items)]
+
+        return self._queue(path, params_, _decode, refresh=refresh)
+
+    def send(self) -> None:
+        """
+        Sends the queued requests, setting the result of each.
+        """
+        actions, self._actions = self._actions, []
+
+        to_send = []
+        for action in actions:
+            cache_key, cached = self.client._get_cached(
+                "get", action.path, params=action.params, refresh=action.refresh
+            )
+            if cached is not None:
+                self._resolve(action, 200, json.loads(cached))
+            else:
+                to_send.append((action, cache_key))
+
+        for i in range(0, len(to_send), MAX_BATCH_ACTIONS):
+            chunk = to_send[i : i + MAX_BATCH_ACTIONS]
+            responses = self.client._request(
+                json.loads,
+                "/batch",
+                method="post",
+                json={"data": {"actions": [action.to_json() for action, _ in chunk]}},
+            )["data"]
+
+            for (action, cache_key), response in zip(chunk, responses):
+                status_code, body = response["status_code"], response["body"]
+                if cache_key and self.client.cache and 200 <= status_code < 300:
+                    self.client.cache.put(cache_key, json.dumps(body).encode())
+                self._resolve(action, status_code, body)
+
+    @staticmethod
+    def _resolve(action: _Action, status_code: int, body: Any) -> None:
+        if not 200 <= status_code < 300:
+            action.result._fail(
+                BatchActionError(path=action.path, status_code=status_code, body=body)
+            )
+            return
+
+        try:
+            action.result._set(action.decode(body))
+        except Exception as e:
+            action.result._fail(e)
+
+    #
+    # Counterparts of the AsanaClient methods
+    #
+
+    def get_user(self, *, user_id: str) -> BatchResult[User]:
+        return self.get(User, f"/users/{user_id}")
+
+    def get_teams(self, *, workspace: str, user_id: str = "me") -> BatchResult[List[Team]]:
+        return self.get_all(
+            Team,
+            f"/users/{user_id}/teams",
+            params={"workspace": workspace, "opt_fields": TEAM_OPT_FIELDS},
+        )
+
+    def get_team_members(self, *, team_id: str) -> BatchResult[List[TeamMembership]]:
+        return self.get_all(TeamMembership, f"/teams/{team_id}/team_memberships")
+
+    def get_projects_by_team(self, *, team_id: str) -> BatchResult[List[Project]]:
+        return self.get_all(
+            Project, f"/teams/{team_id}/projects", params={"opt_fields": PROJECT_OPT_FIELDS}
+        )
+
+    def get_task(
+        self, *, task_id: str, opt_fields: str = f"{TASK_OPT_FIELDS},completed"
+    ) -> BatchResult[Task]:
+        return self.get(Task, f"/tasks/{task_id}", params={"opt_fields": opt_fields})
+
+    def get_user_task_list(self, *, workspace: str, user_id: str = "me") -> BatchResult[TaskList]:
+        return self.get(
+            TaskList, f"/users/{user_id}/user_task_list", params={"workspace": workspace}
+        )
+
+    def get_sections_by_project(
+        self, *, project_id: str, refresh: bool = False
+    ) -> BatchResult[List[Section]]:
+        return self.get_all(Section, f"/projects/{project_id}/sections", refresh=refresh)
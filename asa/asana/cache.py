@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+CACHE_DIR = "~/.cache/asa"
+
+# How long (in seconds) responses are cached for, keyed by the resource type i.e. the last segment
+# of the request path. Resources not listed here (e.g. tasks) are never cached.
+DEFAULT_TTLS: Dict[str, int] = {
+    "workspace_memberships": 24 * 60 * 60,
+    "teams": 24 * 60 * 60,
+    "user_task_list": 24 * 60 * 60,
+    "team_memberships": 60 * 60,
+    "projects": 60 * 60,
+    "sections": 60 * 60,
+}
+
+# Total size of cached responses above which the least recently used are evicted
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    On-disk cache of raw Asana API response bodies.
+
+    Entries are keyed by request method, path, query parameters (including opt_fields) and the
+    identity of the access token; they expire after the TTL for their resource type. Once the total
+    size of the cache exceeds max_bytes, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str = CACHE_DIR,
+        ttls: Dict[str, int] | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        refresh: bool = False,
+    ):
+        """
+        :param directory: Directory in which cached responses are stored.
+        :param ttls: TTL in seconds per resource type; defaults to DEFAULT_TTLS.
+        :param max_bytes: Total size of the cache above which entries are evicted.
+        :param refresh: Whether to ignore existing entries (but still store fresh responses).
+        """
+        self.directory = os.path.join(os.path.expanduser(directory), "responses")
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+
+    def ttl_for(self, path: str) -> int | None:
+        return self.ttls.get(path.rstrip("/").rsplit("/", 1)[-1])
+
+    def key_for(self, *, token: str, method: str, path: str, params: Dict | None) -> str:
+        token_identity = hashlib.sha256(token.encode()).hexdigest()
+        request = json.dumps(
+            [token_identity, method.lower(), path, sorted((params or {}).items())], default=str
+        )
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str, *, ttl: int) -> bytes | None:
+        """
+        Returns the cached response body for the key, or None if there is no fresh entry.
+        """
+        if self.refresh:
+            return None
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                stored_at = float(f.readline())
+                if time.time() - stored_at > ttl:
+                    return None
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # Entries are evicted in order of modification time, so touch the entry on every hit
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Write to a temporary file first so that concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(f"{time.time()}\n".encode())
+            f.write(body)
+        os.replace(tmp_path, self._entry_path(key))
+
+        self._evict()
+
+    def _entries(self) -> List[os.DirEntry]:
+        try:
+            return [e for e in os.scandir(self.directory) if e.name.endswith(".json")]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_bytes -= size
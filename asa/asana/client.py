@@ -1,11 +1,29 @@
 import json
-from typing import List
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
-import requests
-from requests import Session, Response
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Session, Response
+from requests.exceptions import ChunkedEncodingError
 from requests.auth import AuthBase
 
+from asa.asana.cache import ResponseCache
+from asa.asana.retry import RetryPolicy, RetryStats, RateLimiter
+from asa.asana.streaming import STREAM_CHUNK_SIZE, PageStream
+from asa.asana.timings import (
+    RequestTiming,
+    TimedHTTPAdapter,
+    TimingHook,
+    get_connect_time,
+    reset_connect_time,
+)
 from asa.asana.model import (
+    BaseModel,
+    Data,
+    Event,
+    Page,
     User,
     WorkspaceMembership,
     Team,
@@ -14,13 +32,94 @@ from asa.asana.model import (
     TaskList,
     Task,
     Section,
+    IdentityMap,
 )
 
-ASANA_API_BASE = "https://app.asana.com/api/1.0"
+if TYPE_CHECKING:
+    from asa.asana.batch import Batch
+
+# Can be pointed elsewhere (e.g. at the stub server in benchmarks/) via the environment
+ASANA_API_BASE = os.environ.get("ASANA_API_BASE", "https://app.asana.com/api/1.0")
+
+# The task fields requested by default: all those of the Task model
 TASK_OPT_FIELDS = "assignee.name,memberships.section.name,name,assignee_name,projects,workspace,workspace.name,projects.name,permalink_url"
+# The task fields needed to list tasks by section, with their assignees and links
+TASK_LIST_OPT_FIELDS = "name,permalink_url,assignee.name,memberships.section.name"
 PROJECT_OPT_FIELDS = "permalink_url,name"
 TEAM_OPT_FIELDS = "permalink_url,name"
 
+# Maximum page size supported by the Asana API for paginated endpoints
+PAGE_SIZE = 100
+
+type Params = Dict[str, str | int]
+
+# Number of keep-alive connections held open to the Asana API
+DEFAULT_POOL_SIZE = 10
+
+# (connect, read) timeouts in seconds applied to every request
+DEFAULT_TIMEOUT = (3.05, 30)
+
+_shared_session: Session | None = None
+_shared_session_lock = threading.Lock()
+
+
+def new_session(*, pool_size: int = DEFAULT_POOL_SIZE) -> Session:
+    """
+    Creates a new HTTP session backed by a keep-alive connection pool of the given size.
+    """
+    session = Session()
+    adapter = TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def shared_session(*, pool_size: int = DEFAULT_POOL_SIZE) -> Session:
+    """
+    Returns the process-wide HTTP session used by default by all AsanaClient instances, creating
+    it on first use. The pool size only takes effect on that first call.
+    """
+    global _shared_session
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = new_session(pool_size=pool_size)
+
+        return _shared_session
+
+
+class SyncTokenExpiredError(Exception):
+    """
+    Raised when an Events API sync token is missing or too old to be used; carries a fresh token
+    from which events can be read from now on.
+    """
+
+    def __init__(self, sync: str):
+        super().__init__("Sync token is missing or has expired")
+        self.sync = sync
+
+
+def search_params(
+    *, project_id: str, search_text: str, opt_fields: str = TASK_OPT_FIELDS
+) -> Params:
+    """
+    Builds the query parameters for the first page of a task search within a project. The
+    creation date of each task is always requested, as it is needed to page through the results.
+
+    The search endpoint does not support offset pagination, so pages are walked by sorting on
+    creation date and asking for tasks created before the last one seen (via "created_at.before") -
+    see "Search pagination" in the API reference.
+    """
+    return {
+        "text": search_text,
+        "projects.any": project_id,
+        "opt_fields": f"{opt_fields},created_at",
+        "sort_by": "created_at",
+        "sort_ascending": "false",
+        "limit": PAGE_SIZE,
+    }
+
 
 class AsanaClient:
     class AsanaAuth(AuthBase):
@@ -31,7 +130,27 @@ class AsanaClient:
             r.headers["Authorization"] = f"Bearer {self.token}"
             return r
 
-    def _send_request(self, url: str, method: str = "get"):
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Params | None = None,
+        timing: RequestTiming | None = None,
+        read_body: bool = True,
+        **kwargs,
+    ) -> Response:
+        """
+        Sends a request to the Asana API, holding it back as needed to stay within the rate limit
+        and retrying it if throttled or if it fails transiently, then returns the response.
+
+        :param timing: Timing to record the connect, time to first byte and download times of the
+            last attempt at the request in.
+        :param read_body: Whether to read the body of a successful response before returning it;
+            if not, the caller must read it (e.g. via iter_content) or close the response. The
+            bodies of error responses are always read.
+        """
+
         def _response_hook(resp_: Response, *args, **kwargs):
             if self.verbose:
                 print("----------------------------")
@@ -44,76 +163,480 @@ class AsanaClient:
                 print(resp_.text)
                 print("----------------------------")
 
-        req = requests.Request(
-            method,
-            f"{ASANA_API_BASE}{url}",
-            auth=self.AsanaAuth(self.token),
-            hooks={"response": _response_hook},
-        ).prepare()
+        attempt = 0
+
+        while True:
+            if self.rate_limiter and (delay := self.rate_limiter.reserve()) > 0:
+                self.retry_policy.record_rate_limited(delay)
+                time.sleep(delay)
+
+            attempt += 1
+            reset_connect_time()
+            sent_at = time.perf_counter()
+            try:
+                # The body is streamed so that the time to first byte can be told apart from the
+                # time taken to download it
+                resp = self.session.request(
+                    method,
+                    f"{ASANA_API_BASE}{path}",
+                    params=params,
+                    auth=self.auth,
+                    hooks={"response": _response_hook},
+                    timeout=self.timeout,
+                    stream=True,
+                    **kwargs,
+                )
+                headers_received_at = time.perf_counter()
+                content = resp.content if read_body or not resp.ok else b""
+            except (RequestsConnectionError, ChunkedEncodingError):
+                # i.e. failing to connect, or the connection being reset before or while reading
+                # the body
+                if (retry_delay := self.retry_policy.next_delay(attempt, status_code=None)) is None:
+                    raise
+            else:
+                if timing:
+                    timing.attempts = attempt
+                    timing.status = resp.status_code
+                    timing.bytes = len(content)
+                    timing.connect = get_connect_time()
+                    timing.ttfb = headers_received_at - sent_at
+                    timing.download = time.perf_counter() - headers_received_at
+
+                if resp.ok:
+                    return resp
+
+                retry_delay = self.retry_policy.next_delay(
+                    attempt,
+                    status_code=resp.status_code,
+                    retry_after=resp.headers.get("Retry-After"),
+                )
+                if retry_delay is None:
+                    resp.raise_for_status()
+                    return resp
+
+            if self.verbose:
+                print(f"Retrying in {retry_delay:.2f}s: {method.upper()} {path} {params or ''}")
+            time.sleep(retry_delay)
+
+    def _get_cached(
+        self, method: str, path: str, *, params: Params | None = None, refresh: bool = False
+    ) -> Tuple[str | None, bytes | None]:
+        """
+        Looks the response to a request up in the cache.
+
+        :param refresh: Whether to ignore any cached response, e.g. when the resource is known to
+            have changed (the fresh response is still cached).
+        :return: The key under which the response is cached (None if it is not cacheable), along
+            with the cached response body if there is a fresh one.
+        """
+        if not (self.cache and method.lower() == "get" and (ttl := self.cache.ttl_for(path))):
+            return None, None
+
+        cache_key = self.cache.key_for(token=self.token, method=method, path=path, params=params)
+        if refresh:
+            return cache_key, None
+
+        cached = self.cache.get(cache_key, ttl=ttl)
+        if cached is not None and self.verbose:
+            print(f"Cache hit:        {method.upper()} {path} {params or ''}")
+
+        return cache_key, cached
+
+    def _send_request_raw(
+        self,
+        path: str,
+        *,
+        params: Params | None = None,
+        method: str = "get",
+        timing: RequestTiming | None = None,
+        refresh: bool = False,
+        **kwargs,
+    ) -> bytes:
+        """
+        Sends a request to the Asana API (or reads its response from the cache, unless refreshing
+        it - see _get_cached) and returns the raw response body.
+        """
+        cache_key, cached = self._get_cached(method, path, params=params, refresh=refresh)
+        if cached is not None:
+            if timing:
+                timing.cached = True
+                timing.bytes = len(cached)
+            return cached
+
+        resp = self._send(method, path, params=params, timing=timing, **kwargs)
+
+        if self.cache and cache_key:
+            self.cache.put(cache_key, resp.content)
+
+        return resp.content
+
+    def _request[T](
+        self,
+        decode: Callable[[bytes], T],
+        path: str,
+        *,
+        params: Params | None = None,
+        method: str = "get",
+        refresh: bool = False,
+        **kwargs,
+    ) -> T:
+        """
+        Sends a request to the Asana API (or reads its response from the cache) and decodes the
+        response body, then passes the timing of the request to the timing hooks.
+        """
+        timing = RequestTiming(method=method.upper(), path=path)
+        try:
+            with timing.measure("total"):
+                body = self._send_request_raw(
+                    path, params=params, method=method, timing=timing, refresh=refresh, **kwargs
+                )
+                with timing.measure("decode"):
+                    return decode(body)
+        finally:
+            for hook in self.timing_hooks:
+                hook(timing)
+
+    def _send_request(self, path: str, *, params: Params | None = None, method: str = "get") -> Any:
+        """
+        Sends a request to the Asana API and returns the decoded response body (i.e. including the
+        "data" envelope and, for paginated endpoints, "next_page").
+        """
+        return self._request(json.loads, path, params=params, method=method)
+
+    def _intern[T](self, value: T) -> T:
+        """
+        Interns the resources that the decoded model (or list of models) refers to, if the client
+        does so (see intern_refs).
+        """
+        return self.identity_map.intern(value) if self.identity_map is not None else value
+
+    def _decoder[M: BaseModel](self, model: type[M]) -> Callable[[bytes], M]:
+        """
+        Returns a function that decodes and validates a response body as the model (interning the
+        resources it refers to, if the client does so).
+        """
+        if self.identity_map is None:
+            return model.model_validate_json
+
+        return lambda body: self._intern(model.model_validate_json(body))
 
-        resp = Session().send(req)
-        resp.raise_for_status()
+    def _get_model[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None
+    ) -> M:
+        data_model = Data[model]  # type: ignore[valid-type]
+        return self._request(self._decoder(data_model), path, params=params).data
 
-        return resp.json()["data"]
+    def _iter_pages[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None, refresh: bool = False
+    ) -> Iterator[List[M]]:
+        """
+        Yields each page of items from a paginated endpoint, following the "next_page" offset
+        returned by Asana until the last page is reached. Each page is decoded and validated
+        straight from the raw response body in one pass.
 
-    def __init__(self, token: str, verbose: bool):
+        See: https://developers.asana.com/docs/pagination
+        """
+        page_model = Page[model]  # type: ignore[valid-type]
+        params_: Params = {**(params or {}), "limit": PAGE_SIZE}
+
+        while True:
+            page = self._request(self._decoder(page_model), path, params=params_, refresh=refresh)
+            yield page.data
+
+            if not page.next_page:
+                return
+
+            params_ = {**params_, "offset": page.next_page.offset}
+
+    def _iter_models[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None, refresh: bool = False
+    ) -> Iterator[M]:
+        # Cached responses are stored (and so read) whole
+        if self.stream_pages and not (self.cache and self.cache.ttl_for(path)):
+            yield from self._iter_models_streamed(model, path, params=params)
+            return
+
+        for page in self._iter_pages(model, path, params=params, refresh=refresh):
+            yield from page
+
+    def _iter_models_streamed[M: BaseModel](
+        self, model: type[M], path: str, *, params: Params | None = None
+    ) -> Iterator[M]:
+        """
+        As _iter_models, but each page is decoded and validated item by item as its body arrives
+        (see PageStream), so that memory use does not grow with the size of the page. gzip is
+        asked for explicitly, as it can be decompressed incrementally.
+        """
+        params_: Params = {**(params or {}), "limit": PAGE_SIZE}
+
+        while True:
+            timing = RequestTiming(method="GET", path=path)
+            try:
+                with timing.measure("total"):
+                    resp = self._send(
+                        "get",
+                        path,
+                        params=params_,
+                        timing=timing,
+                        read_body=False,
+                        headers={"Accept-Encoding": "gzip"},
+                    )
+
+                with resp:
+                    page = PageStream(
+                        resp.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                        lambda item: self._intern(model.model_validate(item)),
+                        timing=timing,
+                    )
+                    yield from page
+            finally:
+                # The time spent by the caller on each item is not part of the request
+                timing.total += timing.download + timing.decode
+                for hook in self.timing_hooks:
+                    hook(timing)
+
+            if not (next_page := page.members.get("next_page")):
+                return
+
+            params_ = {**params_, "offset": next_page["offset"]}
+
+    def __init__(
+        self,
+        token: str,
+        verbose: bool,
+        *,
+        session: Session | None = None,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        timing_hooks: Iterable[TimingHook] = (),
+        stream_pages: bool = False,
+        intern_refs: bool = False,
+    ):
+        """
+        :param token: Asana personal access token.
+        :param verbose: Whether to print details of requests and responses.
+        :param session: HTTP session to send requests through; defaults to the pooled session
+            shared by all clients in the process (see shared_session).
+        :param timeout: (connect, read) timeouts in seconds.
+        :param cache: Cache for responses to rarely changing resources; disabled if None.
+        :param retry_policy: Policy for retrying throttled and failed requests; its retry budget
+            is shared by all requests made by the client.
+        :param rate_limiter: Rate limiter to hold requests back with; disabled if None.
+        :param timing_hooks: Functions to call with the timing of each request once it completes
+            (or fails), e.g. Timings.record; more can be added to the timing_hooks list later.
+        :param stream_pages: Whether to decode the items of (uncached) list responses one at a
+            time as they arrive, rather than each page in one go; this keeps memory use down to
+            about one item, at the cost of slower decoding.
+        :param intern_refs: Whether to intern the workspaces, projects, sections and users that
+            decoded models refer to in identity_map (see IdentityMap), so that e.g. the tasks on a
+            board share a single instance of each of its sections rather than each holding a copy.
+            This cuts the memory held by processes that keep many models around, at the cost of
+            slower decoding. The map lives as long as the client; it can be emptied by assigning a
+            new IdentityMap.
+        """
         self.token = token
         self.verbose = verbose
+        self.auth = self.AsanaAuth(token)
+        self.session = session if session is not None else shared_session()
+        self.timeout = timeout
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.timing_hooks: List[TimingHook] = list(timing_hooks)
+        self.stream_pages = stream_pages
+        self.identity_map = IdentityMap() if intern_refs else None
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        return self.retry_policy.stats
+
+    def batch(self) -> "Batch":
+        """
+        Returns a context in which independent GET requests are queued, to be sent together via
+        the Batch API - see Batch.
+        """
+        from asa.asana.batch import Batch
+
+        return Batch(self)
 
     # https://developers.asana.com/reference/getuser
     def get_user(self, *, user_id: str) -> User:
-        data = self._send_request(f"/users/{user_id}")
-        return User.model_validate(data)
+        return self._get_model(User, f"/users/{user_id}")
 
     # https://developers.asana.com/reference/getworkspacemembershipsforuser
+    def iter_workspace_memberships(self, *, user_id: str = "me") -> Iterator[WorkspaceMembership]:
+        return self._iter_models(WorkspaceMembership, f"/users/{user_id}/workspace_memberships")
+
     def get_workspace_memberships(self, *, user_id: str = "me") -> List[WorkspaceMembership]:
-        data = self._send_request(f"/users/{user_id}/workspace_memberships")
-        return [WorkspaceMembership.model_validate(wm) for wm in data]
+        return list(self.iter_workspace_memberships(user_id=user_id))
 
     # https://developers.asana.com/reference/getteamsforuser
-    def get_teams(self, *, workspace: str, user_id: str = "me") -> List[Team]:
-        data = self._send_request(
-            f"/users/{user_id}/teams?workspace={workspace}&opt_fields={TEAM_OPT_FIELDS}"
+    def iter_teams(self, *, workspace: str, user_id: str = "me") -> Iterator[Team]:
+        return self._iter_models(
+            Team,
+            f"/users/{user_id}/teams",
+            params={"workspace": workspace, "opt_fields": TEAM_OPT_FIELDS},
         )
-        return [Team.model_validate(t) for t in data]
+
+    def get_teams(self, *, workspace: str, user_id: str = "me") -> List[Team]:
+        return list(self.iter_teams(workspace=workspace, user_id=user_id))
 
     # https://developers.asana.com/reference/getteammembershipsforteam
+    def iter_team_members(self, *, team_id: str) -> Iterator[TeamMembership]:
+        return self._iter_models(TeamMembership, f"/teams/{team_id}/team_memberships")
+
     def get_team_members(self, *, team_id: str) -> List[TeamMembership]:
-        data = self._send_request(f"/teams/{team_id}/team_memberships")
-        return [TeamMembership.model_validate(tm) for tm in data]
+        return list(self.iter_team_members(team_id=team_id))
 
     # https://developers.asana.com/reference/getprojectsforteam
+    def iter_projects_by_team(self, *, team_id: str) -> Iterator[Project]:
+        return self._iter_models(
+            Project, f"/teams/{team_id}/projects", params={"opt_fields": PROJECT_OPT_FIELDS}
+        )
+
     def get_projects_by_team(self, *, team_id: str) -> List[Project]:
-        data = self._send_request(f"/teams/{team_id}/projects?opt_fields={PROJECT_OPT_FIELDS}")
-        return [Project.model_validate(p) for p in data]
+        return list(self.iter_projects_by_team(team_id=team_id))
 
     # https://developers.asana.com/reference/gettasksforproject
-    def get_project_incomplete_tasks(self, *, project_id: str) -> List[Task]:
-        data = self._send_request(
-            f"/projects/{project_id}/tasks?limit=100&completed_since=now&opt_fields={TASK_OPT_FIELDS}"
+    def iter_project_incomplete_tasks(
+        self, *, project_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> Iterator[Task]:
+        return self._iter_models(
+            Task,
+            f"/projects/{project_id}/tasks",
+            params={"completed_since": "now", "opt_fields": opt_fields},
         )
-        return [Task.model_validate(t) for t in data]
+
+    def get_project_incomplete_tasks(
+        self, *, project_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> List[Task]:
+        return list(
+            self.iter_project_incomplete_tasks(project_id=project_id, opt_fields=opt_fields)
+        )
+
+    # https://developers.asana.com/reference/gettasksforsection
+    def iter_section_incomplete_tasks(
+        self, *, section_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> Iterator[Task]:
+        return self._iter_models(
+            Task,
+            f"/sections/{section_id}/tasks",
+            params={"completed_since": "now", "opt_fields": opt_fields},
+        )
+
+    def get_section_incomplete_tasks(
+        self, *, section_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> List[Task]:
+        return list(
+            self.iter_section_incomplete_tasks(section_id=section_id, opt_fields=opt_fields)
+        )
+
+    # https://developers.asana.com/reference/gettask
+    def get_task(self, *, task_id: str, opt_fields: str = f"{TASK_OPT_FIELDS},completed") -> Task:
+        return self._get_model(Task, f"/tasks/{task_id}", params={"opt_fields": opt_fields})
+
+    # https://developers.asana.com/reference/getevents
+    def get_events(self, *, resource_id: str, sync: str | None) -> Tuple[List[Event], str]:
+        """
+        Returns the events on the resource since the sync token was issued, along with the token
+        to use for the next call.
+
+        :raises SyncTokenExpiredError: If no sync token is given or it has expired.
+        """
+        events: List[Event] = []
+
+        while True:
+            params: Params = {"resource": resource_id, **({"sync": sync} if sync else {})}
+            try:
+                body = self._send_request("/events", params=params)
+            except HTTPError as e:
+                if e.response is not None and e.response.status_code == 412:
+                    raise SyncTokenExpiredError(e.response.json()["sync"]) from e
+                raise
+
+            events.extend(Event.model_validate(e) for e in body["data"])
+            sync = body["sync"]
+
+            if not body.get("has_more"):
+                return events, sync
 
     # https://developers.asana.com/reference/getusertasklistforuser
     def get_user_task_list(self, *, workspace: str, user_id: str = "me") -> TaskList:
-        data = self._send_request(f"/users/{user_id}/user_task_list?workspace={workspace}")
-        return TaskList.model_validate(data)
+        return self._get_model(
+            TaskList, f"/users/{user_id}/user_task_list", params={"workspace": workspace}
+        )
 
     # https://developers.asana.com/reference/gettasksforusertasklist
-    def get_user_incomplete_tasks(self, *, task_list_id: str) -> List[Task]:
-        data = self._send_request(
-            f"/user_task_lists/{task_list_id}/tasks?limit=100&completed_since=now&opt_fields={TASK_OPT_FIELDS}"
+    def iter_user_incomplete_tasks(
+        self, *, task_list_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> Iterator[Task]:
+        return self._iter_models(
+            Task,
+            f"/user_task_lists/{task_list_id}/tasks",
+            params={"completed_since": "now", "opt_fields": opt_fields},
+        )
+
+    def get_user_incomplete_tasks(
+        self, *, task_list_id: str, opt_fields: str = TASK_OPT_FIELDS
+    ) -> List[Task]:
+        return list(
+            self.iter_user_incomplete_tasks(task_list_id=task_list_id, opt_fields=opt_fields)
         )
-        return [Task.model_validate(t) for t in data]
 
     # https://developers.asana.com/reference/getsectionsforproject
-    def get_sections_by_project(self, *, project_id: str) -> List[Section]:
-        data = self._send_request(f"/projects/{project_id}/sections")
-        return [Section.model_validate(s) for s in data]
+    def iter_sections_by_project(
+        self, *, project_id: str, refresh: bool = False
+    ) -> Iterator[Section]:
+        """
+        :param refresh: Whether to re-read the sections even if they are cached, e.g. because the
+            board is known to have changed.
+        """
+        return self._iter_models(Section, f"/projects/{project_id}/sections", refresh=refresh)
+
+    def get_sections_by_project(self, *, project_id: str, refresh: bool = False) -> List[Section]:
+        return list(self.iter_sections_by_project(project_id=project_id, refresh=refresh))
 
     # https://developers.asana.com/reference/searchtasksforworkspace
-    def search_tasks(self, *, workspace_id: str, project_id: str, search_text: str) -> List[Task]:
-        data = self._send_request(
-            f"/workspaces/{workspace_id}/tasks/search?text={search_text}&opt_fields={TASK_OPT_FIELDS}&projects.any={project_id}"
+    def iter_search_tasks(
+        self,
+        *,
+        workspace_id: str,
+        project_id: str,
+        search_text: str,
+        opt_fields: str = TASK_OPT_FIELDS,
+    ) -> Iterator[Task]:
+        params = search_params(
+            project_id=project_id, search_text=search_text, opt_fields=opt_fields
+        )
+
+        while True:
+            page = self._request(
+                self._decoder(Page[Task]),
+                f"/workspaces/{workspace_id}/tasks/search",
+                params=params,
+            ).data
+            yield from page
+
+            if len(page) < PAGE_SIZE or not (created_at := page[-1].created_at):
+                return
+
+            params = {**params, "created_at.before": created_at}
+
+    def search_tasks(
+        self,
+        *,
+        workspace_id: str,
+        project_id: str,
+        search_text: str,
+        opt_fields: str = TASK_OPT_FIELDS,
+    ) -> List[Task]:
+        return list(
+            self.iter_search_tasks(
+                workspace_id=workspace_id,
+                project_id=project_id,
+                search_text=search_text,
+                opt_fields=opt_fields,
+            )
         )
-        return [Task.model_validate(t) for t in data]
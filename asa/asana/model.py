@@ -1,4 +1,4 @@
-from typing import Iterable, Optional
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel as PydanticBaseModel
 
@@ -11,6 +11,36 @@ class BaseModel(PydanticBaseModel):
 # Identifier used in the Asana API to identify each resource
 type Gid = str
 
+M = TypeVar("M", bound=BaseModel)
+
+
+class NextPage(BaseModel):
+    """
+    Pointer to the next page of results from a paginated endpoint.
+
+    See: https://developers.asana.com/docs/pagination
+    """
+
+    offset: str
+
+
+class Data(BaseModel, Generic[M]):
+    """
+    The body of a response from an endpoint that returns a single resource.
+    """
+
+    data: M
+
+
+class Page(BaseModel, Generic[M]):
+    """
+    A page of results from a list endpoint. Validating a whole response body as a Page (e.g. with
+    Page[Task].model_validate_json) decodes and validates all its items in a single pass.
+    """
+
+    data: List[M]
+    next_page: Optional[NextPage] = None
+
 
 class NamedRef(BaseModel):
     """
@@ -144,16 +174,120 @@ class Task(NamedRef):
     """
     The details for a task.
 
+    Only the fields asked for (via opt_fields) are returned by the API, so all but gid and name
+    default to empty. Fields that were asked for but are not modelled here are kept as extras.
+
     See: https://developers.asana.com/reference/tasks
     """
 
-    class ProjectMembership(BaseModel):
-        project: Project
+    class Config:
+        extra = "allow"
 
-    class SectionMembership(BaseModel):
-        section: Section
+    class Membership(BaseModel):
+        """
+        A project (and, if requested in opt_fields, the section of it) that the task is in.
+        """
 
-    assignee: Optional[UserCompact]
-    memberships: Iterable[ProjectMembership | SectionMembership]
-    projects: Iterable[Project]
-    workspace: Workspace
+        project: Optional[Project] = None
+        section: Optional[Section] = None
+
+    assignee: Optional[UserCompact] = None
+    memberships: Tuple[Membership, ...] = ()
+    projects: Tuple[Project, ...] = ()
+    workspace: Optional[Workspace] = None
+    completed: Optional[bool] = None
+    created_at: Optional[str] = None
+
+    @property
+    def sections(self) -> Tuple[Section, ...]:
+        """
+        The sections (on any project) that the task is in.
+        """
+        return tuple(m.section for m in self.memberships if m.section)
+
+
+class IdentityMap:
+    """
+    Interns the workspaces, projects, sections and users that decoded models refer to, so that
+    e.g. the tasks on a board share a single instance of each of its sections rather than each
+    holding a copy. Refs are interned by type, gid, name and permalink_url, so a renamed project
+    gets a new instance.
+
+    Interning happens once models have been validated, and copies each model (being frozen) that
+    holds refs - so it adds to the time taken to decode them, in exchange for the memory saved by
+    holding on to them (e.g. in a long-running process).
+    """
+
+    def __init__(self) -> None:
+        self._refs: Dict[Tuple[type, Gid, str, str | None], NamedRef] = {}
+
+    def intern[T](self, value: T) -> T:
+        """
+        Returns the model (or list of models) with the refs it holds, and those held by the models
+        nested in it, swapped for their interned instances.
+        """
+        if type(value) is Task:
+            return self._intern_task(value)  # type: ignore[return-value]
+        if type(value) in _SHARED_REF_TYPES:
+            return self._intern_ref(value)  # type: ignore[arg-type, type-var]
+        if isinstance(value, BaseModel):
+            update = {
+                name: self.intern(field)
+                for name, field in value
+                if isinstance(field, (BaseModel, tuple, list))
+            }
+            return value.model_copy(update=update) if update else value
+        if isinstance(value, list):
+            return [self.intern(item) for item in value]  # type: ignore[return-value]
+        if isinstance(value, tuple) and value and isinstance(value[0], BaseModel):
+            return tuple(map(self.intern, value))  # type: ignore[return-value]
+
+        return value
+
+    def _intern_ref[R: NamedRef](self, ref: R) -> R:
+        return self._refs.setdefault(  # type: ignore[return-value]
+            (type(ref), ref.gid, ref.name, ref.permalink_url), ref
+        )
+
+    def _intern_task(self, task: "Task") -> "Task":
+        # Tasks make up the bulk of what is decoded, so their fields are interned directly rather
+        # than by inspecting each one
+        update: Dict[str, object] = {}
+        if task.assignee is not None:
+            update["assignee"] = self._intern_ref(task.assignee)
+        if task.workspace is not None:
+            update["workspace"] = self._intern_ref(task.workspace)
+        if task.projects:
+            update["projects"] = tuple(map(self._intern_ref, task.projects))
+        if task.memberships:
+            update["memberships"] = tuple(
+                m.model_copy(
+                    update={
+                        "project": self._intern_ref(m.project) if m.project else None,
+                        "section": self._intern_ref(m.section) if m.section else None,
+                    }
+                )
+                for m in task.memberships
+            )
+
+        return task.model_copy(update=update) if update else task
+
+
+class Event(BaseModel):
+    """
+    A change to a resource (or one of its children) that a client subscribed to via a sync token.
+
+    See: https://developers.asana.com/reference/events
+    """
+
+    class Resource(BaseModel):
+        gid: Gid
+        resource_type: str
+
+    action: str
+    resource: Resource
+    parent: Optional[Resource] = None
+
+
+# The refs that IdentityMap interns: those that many models refer to
+_SHARED_REF_TYPES = frozenset({UserCompact, Workspace, Project, Section})
@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque
+
+# Asana's per-minute request quota for free workspaces (paid workspaces allow 1500)
+# See: https://developers.asana.com/docs/rate-limits
+DEFAULT_RATE_LIMIT = 150
+
+# Maximum number of attempts at any one request
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Maximum number of retries across all the requests made by a client (i.e. for one command)
+DEFAULT_RETRY_BUDGET = 20
+
+
+class RetryStats:
+    """
+    Counters of how often requests were retried or held back.
+    """
+
+    def __init__(self):
+        self.retries = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.connection_errors = 0
+        self.rate_limited = 0
+        self.waited_seconds = 0.0
+
+    def __repr__(self):
+        return (
+            f"RetryStats(retries={self.retries}, throttled={self.throttled}, "
+            f"server_errors={self.server_errors}, connection_errors={self.connection_errors}, "
+            f"rate_limited={self.rate_limited}, waited_seconds={self.waited_seconds:.2f})"
+        )
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter that holds requests back to stay within a per-minute quota rather
+    than hitting it and being throttled by the server.
+
+    The limit is over a sliding window: up to the whole quota is let through without waiting, and
+    once it has been used, each further request waits until a minute after the request it takes
+    the place of - so that no more than the quota is let through in any 60 seconds, but commands
+    that send fewer requests than that are never held back.
+
+    :param rate_per_minute: The per-minute quota.
+    """
+
+    WINDOW = 60.0
+
+    def __init__(self, *, rate_per_minute: int = DEFAULT_RATE_LIMIT):
+        self.rate_per_minute = max(1, rate_per_minute)
+        # The times at which the last rate_per_minute requests were (or are due to be) sent
+        self._sent_at: Deque[float] = deque(maxlen=self.rate_per_minute)
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserves a slot for a request, returning how many seconds the caller must wait before
+        sending it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            send_at = now
+            if len(self._sent_at) == self.rate_per_minute:
+                send_at = max(now, self._sent_at[0] + self.WINDOW)
+            self._sent_at.append(send_at)
+
+            return send_at - now
+
+
+class RetryPolicy:
+    """
+    Decides whether and when failed requests are retried: 429 responses after the delay given in
+    their Retry-After header, and 5xx responses and connection errors after a jittered exponential
+    backoff. Retries stop once a request has used up its attempts or the client its retry budget.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        budget: int = DEFAULT_RETRY_BUDGET,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        self.max_attempts = max_attempts
+        self.budget = budget
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": see https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def next_delay(
+        self, attempt: int, *, status_code: int | None, retry_after: str | None = None
+    ) -> float | None:
+        """
+        Returns how many seconds to wait before retrying a failed request, or None if it should
+        not be retried.
+
+        :param attempt: The number of attempts made so far at the request.
+        :param status_code: The response status code, or None if the request failed to connect.
+        :param retry_after: The value of the response's Retry-After header, if any.
+        """
+        if status_code is not None and status_code != 429 and status_code < 500:
+            return None
+
+        with self._lock:
+            if attempt >= self.max_attempts or self.stats.retries >= self.budget:
+                return None
+
+            if status_code is None:
+                self.stats.connection_errors += 1
+            elif status_code == 429:
+                self.stats.throttled += 1
+            else:
+                self.stats.server_errors += 1
+
+            try:
+                delay = float(retry_after) if retry_after else self._backoff(attempt)
+            except ValueError:
+                delay = self._backoff(attempt)
+
+            self.stats.retries += 1
+            self.stats.waited_seconds += delay
+
+            return delay
+
+    def record_rate_limited(self, delay: float) -> None:
+        with self._lock:
+            self.stats.rate_limited += 1
+            self.stats.waited_seconds += delay
@@ -0,0 +1,151 @@
+import codecs
+import json
+import re
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List
+
+from asa.asana.timings import RequestTiming
+
+# Size of the chunks in which streamed response bodies are read (after decompression)
+STREAM_CHUNK_SIZE = 16 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_json_decoder = json.JSONDecoder()
+
+
+class PageStream[T]:
+    """
+    Decodes the items of a page of results (the "data" array of the response body) one at a time
+    as the body arrives in chunks, so that only the item being decoded - and the chunk it is in -
+    is held in memory rather than the whole body. The other members of the body (e.g. "next_page")
+    are available in `members` once all the items have been read.
+
+    :param decode_item: Converts each item, as decoded from JSON, e.g. into a model.
+    :param timing: Timing to add the time spent reading chunks (download) and decoding items
+        (decode), and the number of bytes read, to.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        decode_item: Callable[[Any], T],
+        *,
+        timing: RequestTiming | None = None,
+    ):
+        self._chunks = iter(chunks)
+        self._decode_item = decode_item
+        self._timing = timing
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self.members: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[T]:
+        self._expect("{")
+        if self._peek() == "}":
+            return
+
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == "data":
+                yield from self._items()
+            else:
+                self.members[key] = self._value()
+
+            if self._expect(",}") == "}":
+                return
+
+    def _items(self) -> Iterator[T]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            item = self._value()
+            with self._measure("decode"):
+                decoded = self._decode_item(item)
+            yield decoded
+
+            if self._expect(",]") == "]":
+                return
+
+    def _measure(self, phase: str) -> ContextManager[None]:
+        return self._timing.measure(phase) if self._timing else nullcontext()
+
+    def _fill(self, *, min_length: int = 0) -> bool:
+        """
+        Reads the next chunk of the body into the buffer, dropping what has been decoded already,
+        then carries on reading chunks until at least min_length characters are buffered.
+
+        :return: False if the whole body had already been read.
+        """
+        if self._eof:
+            return False
+
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+
+        chunks: List[str] = []
+        length = len(self._buffer)
+        while not chunks or length < min_length:
+            with self._measure("download"):
+                chunk = next(self._chunks, None)
+
+            if chunk is None:
+                self._eof = True
+                chunks.append(self._text_decoder.decode(b"", final=True))
+                break
+
+            if self._timing:
+                self._timing.bytes += len(chunk)
+            chunks.append(text := self._text_decoder.decode(chunk))
+            length += len(text)
+
+        self._buffer += "".join(chunks)
+        return len(chunks) > 1 or not self._eof
+
+    def _peek(self) -> str:
+        """
+        Skips any whitespace, returning the next character ("" at the end of the body).
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        if (c := self._peek()) == "" or c not in chars:
+            raise ValueError(f"Expected one of {chars!r} in the response body, found {c!r}")
+        self._pos += 1
+        return c
+
+    def _value(self) -> Any:
+        """
+        Decodes the JSON value at the current position, reading more of the body as needed.
+        """
+        self._peek()
+
+        while True:
+            try:
+                with self._measure("decode"):
+                    value, end = _json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value is (most likely) cut off at the end of the buffer. At least double what
+                # is buffered before trying again, so that a long value is not re-scanned from its
+                # start for every chunk
+                if self._fill(min_length=2 * (len(self._buffer) - self._pos)):
+                    continue
+                raise
+
+            # A number at the end of the chunk may carry on in the next one
+            if end == len(self._buffer) and self._fill():
+                continue
+
+            self._pos = end
+            return value
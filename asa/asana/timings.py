@@ -0,0 +1,180 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class RequestTiming:
+    """
+    How long each phase of a request to the Asana API took, in seconds:
+
+    - connect: opening a new connection (including the TLS handshake); 0 if a pooled connection
+      was reused
+    - ttfb: from sending the request until the response headers arrived (including connect)
+    - download: reading the response body
+    - decode: decoding the JSON body and validating it into models, which happen in a single pass
+    - total: the whole request, including any retries and the time spent waiting before them
+
+    Requests answered from the response cache only have decode and total timings.
+    """
+
+    def __init__(self, *, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.status: int | None = None
+        self.attempts = 0
+        self.cached = False
+        self.bytes = 0
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.decode = 0.0
+        self.total = 0.0
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """
+        Adds the time spent in the block to the given phase.
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, phase, getattr(self, phase) + time.perf_counter() - started_at)
+
+    def to_dict(self) -> Dict:
+        return dict(vars(self))
+
+    def __repr__(self):
+        return (
+            f"RequestTiming({self.method} {self.path}, status={self.status}, "
+            f"attempts={self.attempts}, cached={self.cached}, bytes={self.bytes}, "
+            f"connect={self.connect:.3f}, ttfb={self.ttfb:.3f}, download={self.download:.3f}, "
+            f"decode={self.decode:.3f}, total={self.total:.3f})"
+        )
+
+
+# Hooks are called with the timing of each request made by a client once it completes (or fails)
+type TimingHook = Callable[[RequestTiming], None]
+
+
+class Timings:
+    """
+    Collects the timings of requests, e.g. for reporting once a command completes. Register
+    `record` as a timing hook of the clients whose requests should be collected.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[RequestTiming] = []
+        self._lock = threading.Lock()
+
+    def record(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self.requests.append(timing)
+
+    def to_json(self) -> str:
+        return json.dumps([t.to_dict() for t in self.requests], indent=2)
+
+    def to_table(self) -> str:
+        """
+        Formats the timings as a table of one request per line (in milliseconds), followed by the
+        totals for all requests.
+        """
+
+        def _ms(seconds: float) -> str:
+            return f"{seconds * 1000:.1f}"
+
+        header = ("request", "status", "connect", "ttfb", "download", "decode", "total", "bytes")
+        rows: List[Tuple[str, ...]] = [
+            (
+                f"{t.method} {t.path}",
+                "cache" if t.cached else str(t.status or "-"),
+                _ms(t.connect),
+                _ms(t.ttfb),
+                _ms(t.download),
+                _ms(t.decode),
+                _ms(t.total),
+                str(t.bytes),
+            )
+            for t in self.requests
+        ]
+        rows.append(
+            (
+                f"total ({len(self.requests)} requests)",
+                "",
+                *(
+                    _ms(sum(getattr(t, phase) for t in self.requests))
+                    for phase in ("connect", "ttfb", "download", "decode", "total")
+                ),
+                str(sum(t.bytes for t in self.requests)),
+            )
+        )
+
+        widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in [header, *rows]
+        )
+
+
+#
+# Connection timing
+#
+
+# Time spent opening connections on the current thread since it was last reset
+_connect_time = threading.local()
+
+
+def reset_connect_time() -> None:
+    _connect_time.seconds = 0.0
+
+
+def get_connect_time() -> float:
+    return getattr(_connect_time, "seconds", 0.0)
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started_at = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = get_connect_time() + time.perf_counter() - started_at
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        started_at = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = get_connect_time() + time.perf_counter() - started_at
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections record how long they take to open (see get_connect_time).
+    """
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
@@ -1,18 +1,19 @@
 import argparse
 import os
-import colorama
+import sys
 
-from .config import get_workspace, get_default_team, get_default_board
-from .commands import teams, team, boards, board, me, manage_config, search_tasks
+from .asana.retry import DEFAULT_RATE_LIMIT
+from .output import OUTPUT_FORMATS
 
-colorama.init()
+# Note that the commands (and so the Asana client, models etc.) are only imported once the command
+# line has been parsed, and only the defaults for the command being run are read from the config,
+# so that `asa --help` and the like start quickly.
 
 
-def execute_cli():
-    # Parse command line
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument(
-        "--token", default=os.environ.get("ASANA_TOKEN"), help="Asana personal access token"
+        "--token", help="Asana personal access token (defaults to the ASANA_TOKEN variable)"
     )
     parser.add_argument(
         "-v",
@@ -21,6 +22,63 @@ def execute_cli():
         default=False,
         help="Whether to print details of requests and responses",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Do not read or write cached responses for rarely changing resources (e.g. teams)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        dest="refresh_cache",
+        default=False,
+        help="Ignore cached responses, re-fetching (and re-caching) everything",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        default=DEFAULT_RATE_LIMIT,
+        help="The maximum number of requests to send per minute (0 for no limit)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="Decode lists of tasks item by item as they arrive, keeping memory use flat for "
+        "large boards (at the cost of slower decoding)",
+    )
+    parser.add_argument(
+        "--fields",
+        help="Comma-separated task fields (Asana opt_fields) to request in addition to those the "
+        "command shows, e.g. for scripts",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="The output format: coloured text, or records (e.g. one per task) as a JSON array, "
+        "newline-delimited JSON or tab-separated values, written out as they are produced",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_const",
+        const="table",
+        help="On exit, print a table of how long each phase of each request took to stderr",
+    )
+    parser.add_argument(
+        "--timings-json",
+        action="store_const",
+        const="json",
+        dest="timings",
+        help="As --timings, but print the timings as JSON",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        default=False,
+        help="Run the command in this process even if the daemon (see asa daemon) is running",
+    )
 
     command_parser = parser.add_subparsers(title="commands")
 
@@ -28,7 +86,22 @@ def execute_cli():
     # asa me
     #
     me_parser = command_parser.add_parser("me", help="Get incomplete tasks for the current user")
-    me_parser.add_argument("-w", "--workspace", default=get_workspace(), help="The workspace id")
+    me_workspace_group = me_parser.add_mutually_exclusive_group()
+    me_workspace_group.add_argument(
+        "-w", "--workspace", help="The workspace id (defaults to the default workspace)"
+    )
+    me_workspace_group.add_argument(
+        "--all-workspaces",
+        action="store_true",
+        default=False,
+        help="Get the tasks in all the workspaces the user is in, grouped by workspace",
+    )
+    me_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="With --all-workspaces, the maximum number of workspaces to fetch concurrently",
+    )
     me_parser.add_argument(
         "-o",
         "--open",
@@ -36,15 +109,24 @@ def execute_cli():
         default=False,
         help="Open the tasks assigned to the current user in the default browser",
     )
-    me_parser.set_defaults(func=me)
+    me_parser.set_defaults(command="me")
 
     #
     # asa teams
     #
     teams_parser = command_parser.add_parser("teams", help="List the teams the user is on")
     teams_parser.add_argument("-u", "--user", default="me", help="The user id")
-    teams_parser.add_argument("-w", "--workspace", default=get_workspace(), help="The workspace id")
-    teams_parser.set_defaults(func=teams)
+    teams_workspace_group = teams_parser.add_mutually_exclusive_group()
+    teams_workspace_group.add_argument(
+        "-w", "--workspace", help="The workspace id (defaults to the default workspace)"
+    )
+    teams_workspace_group.add_argument(
+        "--all-workspaces",
+        action="store_true",
+        default=False,
+        help="List the teams in all the workspaces the current user is in, grouped by workspace",
+    )
+    teams_parser.set_defaults(command="teams")
 
     #
     # asa team
@@ -53,10 +135,9 @@ def execute_cli():
     team_parser.add_argument(
         "-t",
         "--team",
-        default=get_default_team(),
-        help="The team identifier from the asa configuration",
+        help="The team identifier from the asa configuration (defaults to the default team)",
     )
-    team_parser.set_defaults(func=team)
+    team_parser.set_defaults(command="team")
 
     #
     # asa boards
@@ -67,10 +148,9 @@ def execute_cli():
     boards_parser.add_argument(
         "-t",
         "--team",
-        default=get_default_team(),
-        help="The team identifier from the asa configuration",
+        help="The team identifier from the asa configuration (defaults to the default team)",
     )
-    boards_parser.set_defaults(func=boards)
+    boards_parser.set_defaults(command="boards")
 
     #
     # asa board
@@ -81,8 +161,28 @@ def execute_cli():
     board_parser.add_argument(
         "-b",
         "--board",
-        default=get_default_board(),
-        help="The board identifier from the asa configuration",
+        action="append",
+        dest="boards",
+        help="The board identifier from the asa configuration; may be repeated to show several "
+        "boards (defaults to the default board)",
+    )
+    board_parser.add_argument(
+        "--all",
+        action="store_true",
+        default=False,
+        help="Show all the boards from the asa configuration",
+    )
+    board_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="The maximum number of boards to fetch concurrently",
+    )
+    board_parser.add_argument(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Fetch the board from Asana even if there is a local snapshot of it (see sync)",
     )
     board_parser.add_argument(
         "-o",
@@ -91,7 +191,48 @@ def execute_cli():
         default=False,
         help="Open the board in the default browser",
     )
-    board_parser.set_defaults(func=board)
+    board_parser.add_argument(
+        "--watch",
+        action="store_true",
+        default=False,
+        help="Keep the board on screen, checking for changes and redrawing the sections that "
+        "changed until interrupted",
+    )
+    board_parser.add_argument(
+        "--interval",
+        type=int,
+        help="With --watch, the number of seconds between checks for changes, which backs off "
+        "while nothing changes (default: 10)",
+    )
+    board_parser.add_argument(
+        "--max-interval",
+        type=int,
+        help="With --watch, the maximum number of seconds between checks for changes "
+        "(default: 120)",
+    )
+    board_parser.set_defaults(command="board")
+
+    #
+    # asa sync
+    #
+    sync_parser = command_parser.add_parser(
+        "sync", help="Update the local snapshots of boards, fetching only what changed"
+    )
+    sync_parser.add_argument(
+        "-b",
+        "--board",
+        action="append",
+        dest="boards",
+        help="The board identifier from the asa configuration; may be repeated (defaults to all "
+        "the boards in the configuration)",
+    )
+    sync_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="The maximum number of boards to sync concurrently",
+    )
+    sync_parser.set_defaults(command="sync", all=True)
 
     #
     # asa search
@@ -105,10 +246,39 @@ def execute_cli():
     search_parser.add_argument(
         "-b",
         "--board",
-        default=get_default_board(),
-        help="The board identifier from the asa configuration to use as the target of the search",
+        action="append",
+        dest="boards",
+        help="The board identifier from the asa configuration to use as the target of the search; "
+        "may be repeated to search several boards (defaults to the default board)",
+    )
+    search_parser.add_argument(
+        "--all-boards",
+        action="store_true",
+        dest="all",
+        default=False,
+        help="Search all the boards from the asa configuration",
+    )
+    search_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="The maximum number of boards to search concurrently",
     )
-    search_parser.set_defaults(func=search_tasks)
+    search_parser.add_argument(
+        "-l",
+        "--local",
+        action="store_true",
+        default=False,
+        help="Search the local task store across all configured boards instead of Asana",
+    )
+    search_parser.add_argument(
+        "--reindex",
+        action="store_true",
+        dest="refresh_store",
+        default=False,
+        help="Repopulate the local task store from Asana before searching (implies --local)",
+    )
+    search_parser.set_defaults(command="search_tasks")
 
     #
     # asa config
@@ -121,14 +291,116 @@ def execute_cli():
         default=False,
         help="Initialise a new configuration file",
     )
-    config_parser.set_defaults(func=manage_config)
+    config_parser.set_defaults(command="manage_config")
+
+    #
+    # asa daemon
+    #
+    daemon_parser = command_parser.add_parser(
+        "daemon",
+        help="Run commands for other asa invocations from a warm background process, which they "
+        "use when it is running",
+    )
+    daemon_parser.set_defaults(command="daemon")
+
+    return parser
+
+
+def _discard_stdout() -> None:
+    """
+    Points stdout at /dev/null, so that flushing it on exit does not fail again once whatever was
+    reading it has gone away. Output that is not written to a file (e.g. the daemon's output to
+    the front end) is left alone.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return
+    os.dup2(os.open(os.devnull, os.O_WRONLY), fd)
+
+
+def run_command(args: argparse.Namespace) -> None:
+    """
+    Runs the command parsed from the command line in this process.
+    """
+    from . import commands
+
+    if args.format != "text" and getattr(args, "watch", False):
+        sys.exit("asa: board --watch only supports --format text")
+
+    # Collects the timings of the requests made by the clients created by the command
+    args.request_timings = None
+    if args.timings:
+        from .asana.timings import Timings
+
+        args.request_timings = Timings()
+
+    # Writes the output of the command in the machine-readable format asked for, if any
+    args.records = None
+    if args.format != "text":
+        from .output import new_record_writer
+
+        args.records = new_record_writer(args.format)
 
+    try:
+        try:
+            getattr(commands, args.command)(args)
+        finally:
+            if args.records:
+                args.records.close()
+    except BrokenPipeError:
+        # Whatever was reading the output stopped (e.g. `asa ... | head`), so stop quietly
+        _discard_stdout()
+        sys.exit(1)
+    finally:
+        if args.request_timings:
+            print(
+                args.request_timings.to_json()
+                if args.timings == "json"
+                else args.request_timings.to_table(),
+                file=sys.stderr,
+            )
+
+
+def execute_cli():
+    parser = build_parser()
     args = parser.parse_args()
 
+    if not hasattr(args, "command"):
+        parser.print_help()
+        return
+
     #
-    # Execute command
+    # Execute command, on the daemon if it is running - other than the daemon itself, the config
+    # wizard (which prompts for input) and board --watch (which runs until interrupted)
     #
-    if hasattr(args, "func"):
-        args.func(args)
-    else:
-        parser.print_help()
+    if not (
+        args.no_daemon
+        or args.command == "daemon"
+        or getattr(args, "init", False)
+        or getattr(args, "watch", False)
+    ):
+        from .daemon import forward
+
+        try:
+            exit_code = forward(sys.argv[1:])
+        except BrokenPipeError:
+            # As in run_command
+            _discard_stdout()
+            sys.exit(1)
+
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    import colorama
+
+    colorama.init()
+
+    if args.command == "daemon":
+        from .daemon import serve
+
+        serve()
+        return
+
+    args.token = args.token or os.environ.get("ASANA_TOKEN")
+    run_command(args)
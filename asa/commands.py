@@ -1,14 +1,38 @@
+from __future__ import annotations
+
 import os
 import re
-from typing import Sequence, Iterable, List, Dict
+import sys
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Sequence,
+    Iterable,
+    Iterator,
+    List,
+    Dict,
+    Callable,
+    Set,
+    TextIO,
+    Tuple,
+)
 
-from asa.asana.client import AsanaClient
 from colorama import Fore
 
-from .asana.model import Workspace, Task, Section
+# The Asana client, models and local stores pull in heavy dependencies (requests, pydantic,
+# sqlite3), so they are only imported by the commands that use them - see execute_cli.
+if TYPE_CHECKING:
+    from asa.asana.client import AsanaClient
+    from .asana.model import Workspace, Task, Section
+    from .store import TaskStore
+    from .snapshot import BoardSnapshot
+    from .asana.retry import RateLimiter
+    from .output import Record, RecordWriter
+
 from .config import (
     get_board_config,
     to_team_id,
+    to_board_id,
     get_workspace,
     initialise_config,
     get_default_board,
@@ -16,19 +40,129 @@ from .config import (
     get_all_boards,
     get_all_teams,
     CONFIG_FILE_PATH,
+    ConfigSection,
     reload_config,
 )
 
 
+# Default number of requests issued concurrently by commands that fan out over several resources
+DEFAULT_JOBS = 4
+
+# Polling interval of board --watch, in seconds: it doubles (up to the maximum) each time a poll
+# finds that nothing changed, and drops back once something does
+WATCH_INTERVAL = 10
+WATCH_MAX_INTERVAL = 120
+
+# The task fields that are resources, with the fields of theirs that the models need: when one is
+# asked for without those (e.g. just "assignee"), the API gives only its gid
+_TASK_REF_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "assignee": ("assignee.name",),
+    "workspace": ("workspace.name",),
+    "projects": ("projects.name",),
+    "memberships": ("memberships.project.name", "memberships.section.name"),
+}
+
+# Rate limiters shared by the clients of all the commands run by this process, by rate per minute
+_rate_limiters: Dict[int, RateLimiter] = {}
+
+
 def _new_asana_client(args) -> AsanaClient:
-    return AsanaClient(args.token, args.verbose)
+    from asa.asana.cache import ResponseCache
+    from asa.asana.client import AsanaClient
+    from asa.asana.retry import RateLimiter
+
+    cache = None if args.no_cache else ResponseCache(refresh=args.refresh_cache)
+
+    # Requests are limited per process rather than per command, as the daemon (see asa.daemon) runs
+    # many commands
+    rate_limiter = None
+    if args.rate_limit > 0:
+        if args.rate_limit not in _rate_limiters:
+            _rate_limiters[args.rate_limit] = RateLimiter(rate_per_minute=args.rate_limit)
+        rate_limiter = _rate_limiters[args.rate_limit]
+
+    return AsanaClient(
+        args.token,
+        args.verbose,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        timing_hooks=[args.request_timings.record] if args.request_timings else [],
+        stream_pages=args.stream,
+    )
+
+
+def _task_fields(args, fields: str) -> str:
+    """
+    Returns the task fields (opt_fields) to request for a command that shows the given fields,
+    along with any others asked for with --fields (and, for those that are resources, the fields
+    of theirs that the models need - see _TASK_REF_FIELDS).
+    """
+    extra_fields = chain.from_iterable(
+        (f, *_TASK_REF_FIELDS.get(f.split(".")[0], ())) for f in (args.fields or "").split(",") if f
+    )
+    return ",".join(dict.fromkeys(chain((f for f in fields.split(",") if f), extra_fields)))
+
+
+def _extra_task_fields(args) -> List[str]:
+    """
+    Returns the (top-level) task fields asked for with --fields, which are included in records.
+    """
+    return list(dict.fromkeys(f.split(".")[0] for f in (args.fields or "").split(",") if f))
+
+
+def _map_concurrently[T, R](
+    func: Callable[[T], R], items: Sequence[T], *, max_workers: int
+) -> Iterator[R]:
+    """
+    Applies func to each item on a bounded thread pool, yielding the results in the order of items
+    as each one becomes available.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        yield from executor.map(func, items)
 
 
-def _print_named_refs(refs: Iterable[Workspace]):
+def _map_as_completed[T, R](
+    func: Callable[[T], R], items: Sequence[T], *, max_workers: int
+) -> Iterator[Tuple[T, R]]:
+    """
+    Applies func to each item on a bounded thread pool, yielding each item along with its result
+    as soon as that result is available (i.e. in order of completion).
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        futures = {executor.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _print_named_refs(
+    refs: Iterable[Workspace],
+    *,
+    records: RecordWriter | None = None,
+    context: Record | None = None,
+):
+    """
+    Prints the refs, or writes them as records (each with the fields in context) if a record writer
+    is given.
+    """
     for ref in refs:
-        print(
-            f"{ref.gid} {_to_link(ref.permalink_url, ref.name) if ref.permalink_url else ref.name}"
-        )
+        if records is not None:
+            records.write(
+                {
+                    **(context or {}),
+                    "gid": ref.gid,
+                    "name": ref.name,
+                    "permalink_url": ref.permalink_url,
+                }
+            )
+        else:
+            print(
+                f"{ref.gid} "
+                f"{_to_link(ref.permalink_url, ref.name) if ref.permalink_url else ref.name}"
+            )
 
 
 def _to_link(url: str, label: str) -> str:
@@ -39,33 +173,116 @@ def _to_link(url: str, label: str) -> str:
     return escape_mask.format(url, label)
 
 
-def _print_tasks(tasks: List[Task], *, section_id_allowlist: Sequence[str] = ()):
-    def _group_tasks_by_section(tasks_: Iterable[Task]) -> Dict[Section, List[Task]]:
-        accumulated: Dict[Section, List[Task]] = {}
-
-        for task_ in tasks_:
-            sections = [
-                tm.section for tm in task_.memberships if isinstance(tm, Task.SectionMembership)
-            ]  # type: ignore
-            for section_ in sections:
-                if section_ in accumulated:
-                    accumulated[section_].append(task_)
-                else:
-                    accumulated[section_] = [task_]
-
-        return accumulated
+def _task_record(
+    task: Task, section: Section, *, context: Record | None, extra_fields: Sequence[str]
+) -> Record:
+    record = {
+        **(context or {}),
+        "gid": task.gid,
+        "name": task.name,
+        "assignee": task.assignee.name if task.assignee else None,
+        "section": section.name,
+        "permalink_url": task.permalink_url,
+    }
+    for field in extra_fields:
+        record.setdefault(field, getattr(task, field, None))
+    return record
+
+
+def _print_tasks(
+    tasks: Iterable[Task],
+    *,
+    sections: Sequence[Section] | None = None,
+    section_id_allowlist: Sequence[str] = (),
+    file: TextIO | None = None,
+    records: RecordWriter | None = None,
+    context: Record | None = None,
+    extra_fields: Sequence[str] = (),
+):
+    """
+    Prints the tasks grouped by section (to file, or stdout by default), writing each section in
+    one go.
+
+    If the sections of the board the tasks are from are given, they are printed in board order,
+    followed by any sections that are not among them (e.g. added since the sections were read, or
+    on other boards) once all the tasks have arrived. Tasks that are already in memory (e.g. from a
+    snapshot) are put in board order first; tasks that are still arriving are expected in board
+    order, and each section is printed as soon as a task from a later section arrives - a task
+    that turns up after its section was printed is printed under the section's name again.
+    Otherwise, the sections are printed once all the tasks have arrived.
+
+    If a record writer is given, a record (with the fields in context and extra_fields) is instead
+    written for each task in each section that would be printed, as soon as the task arrives.
+    """
 
     def _to_initials(name: str):
         return re.sub("[a-z ]", "", name)[:2]
 
-    for section, tasks in reversed(list(_group_tasks_by_section(tasks).items())):
-        if (len(section_id_allowlist) == 0) or (section.gid in section_id_allowlist):
-            print(f"{Fore.CYAN}{section.name}{Fore.RESET}")
+    def _to_line(task_: Task) -> str:
+        return f"  [{_to_initials(task_.assignee.name) if task_.assignee else '--'}] {_to_link(str(task_.permalink_url), task_.name)}\n"
+
+    def _write_section(section_: Section, lines: List[str]):
+        if lines and ((len(section_id_allowlist) == 0) or (section_.gid in section_id_allowlist)):
+            out.write(f"{Fore.CYAN}{section_.name}{Fore.RESET}\n{''.join(lines)}")
+            out.flush()
+
+    if records is not None:
+        for task_ in tasks:
+            for section in task_.sections:
+                if len(section_id_allowlist) == 0 or section.gid in section_id_allowlist:
+                    records.write(
+                        _task_record(task_, section, context=context, extra_fields=extra_fields)
+                    )
+        return
+
+    out = file if file is not None else sys.stdout
+    section_positions = {s.gid: i for i, s in enumerate(sections)} if sections is not None else {}
+    next_position = 0
+
+    if sections is not None and isinstance(tasks, (list, tuple)):
+        # e.g. the tasks in a snapshot are in the order they were added or last changed
+        tasks = sorted(
+            tasks,
+            key=lambda t: min(
+                (section_positions[s.gid] for s in t.sections if s.gid in section_positions),
+                default=len(section_positions),
+            ),
+        )
+    # Section gid -> the section and the lines for its tasks that are yet to be printed
+    pending: Dict[str, Tuple[Section, List[str]]] = {}
+
+    for task_ in tasks:
+        for section in task_.sections:
+            if sections is None or (position := section_positions.get(section.gid)) is None:
+                pending.setdefault(section.gid, (section, []))[1].append(_to_line(task_))
+            elif position < next_position:
+                # The section was already printed, so the task arrived out of board order
+                _write_section(section, [_to_line(task_)])
+            else:
+                pending.setdefault(section.gid, (section, []))[1].append(_to_line(task_))
+
+                # Tasks arrive in board order, so all the sections before this one are complete
+                for s in sections[next_position:position]:
+                    _write_section(s, pending.pop(s.gid, (s, []))[1])
+                next_position = position
+
+    if sections is None:
+        for section, lines in reversed(list(pending.values())):
+            _write_section(section, lines)
+    else:
+        for s in sections[next_position:]:
+            _write_section(s, pending.pop(s.gid, (s, []))[1])
+        # i.e. the sections that are not among those given
+        for section, lines in pending.values():
+            _write_section(section, lines)
 
-            for task_ in tasks:
-                print(
-                    f"  [{_to_initials(task_.assignee.name) if task_.assignee else '--'}] {_to_link(str(task_.permalink_url), task_.name)}"
-                )
+
+def _get_all_workspaces(asana: AsanaClient) -> List[Workspace]:
+    return [wm.workspace for wm in asana.get_workspace_memberships(user_id="me")]
+
+
+def _print_workspace_header(workspace: Workspace):
+    print(f"{Fore.MAGENTA}==> {workspace.name}{Fore.RESET}", flush=True)
 
 
 def me(args):
@@ -73,29 +290,83 @@ def me(args):
     Prints basic details of the tasks assigned to the current user
 
     :param args:
+        workspace: The workspace to get the tasks in; defaults to the default workspace.
+        all_workspaces: Whether to get the tasks in all the user's workspaces instead.
+        jobs: The maximum number of workspaces to fetch the tasks of concurrently.
         open: Whether to bypass CLI output and just open the user details page in the browser.
     """
-    asana = _new_asana_client(args)
-    task_list = asana.get_user_task_list(workspace=args.workspace, user_id="me")
+    from .asana.client import TASK_LIST_OPT_FIELDS
 
-    task_list_id = task_list.gid
-    tasks = asana.get_user_incomplete_tasks(task_list_id=task_list_id)
+    asana = _new_asana_client(args)
+    opt_fields = _task_fields(args, "name,permalink_url" if args.open else TASK_LIST_OPT_FIELDS)
+
+    def _show(tasks_: Iterable[Task], *, context: Record | None = None):
+        if args.open:
+            for task in tasks_:
+                os.system(f"open {task.permalink_url}")
+        else:
+            _print_tasks(
+                tasks_,
+                records=args.records,
+                context=context,
+                extra_fields=_extra_task_fields(args),
+            )
+
+    if not args.all_workspaces:
+        task_list = asana.get_user_task_list(
+            workspace=args.workspace or get_workspace(), user_id="me"
+        )
+        _show(asana.iter_user_incomplete_tasks(task_list_id=task_list.gid, opt_fields=opt_fields))
+        return
+
+    # The task lists of all the workspaces are looked up in one go, then the tasks in each are
+    # fetched concurrently, and printed a workspace at a time
+    workspaces = _get_all_workspaces(asana)
+    with asana.batch() as batch:
+        task_lists = [batch.get_user_task_list(workspace=w.gid, user_id="me") for w in workspaces]
+
+    all_tasks = _map_concurrently(
+        lambda task_list: asana.get_user_incomplete_tasks(
+            task_list_id=task_list.result().gid, opt_fields=opt_fields
+        ),
+        task_lists,
+        max_workers=args.jobs or DEFAULT_JOBS,
+    )
 
-    if args.open:
-        for task in tasks:
-            os.system(f"open {task.permalink_url}")
-    else:
-        _print_tasks(tasks)
+    for workspace, tasks in zip(workspaces, all_tasks):
+        if not (args.open or args.records):
+            _print_workspace_header(workspace)
+        _show(tasks, context={"workspace": workspace.name})
 
 
 def teams(args):
     """
     Lists all the teams that the user is on.
+
+    :param args:
+        user: The user to list the teams of.
+        workspace: The workspace to list the teams in; defaults to the default workspace.
+        all_workspaces: Whether to list the teams in all the current user's workspaces instead.
     """
     asana = _new_asana_client(args)
-    teams_ = asana.get_teams(workspace=args.workspace, user_id=args.user)
 
-    _print_named_refs(teams_)
+    if not args.all_workspaces:
+        teams_ = asana.get_teams(workspace=args.workspace or get_workspace(), user_id=args.user)
+        _print_named_refs(teams_, records=args.records)
+        return
+
+    workspaces = _get_all_workspaces(asana)
+    with asana.batch() as batch:
+        all_teams_ = [batch.get_teams(workspace=w.gid, user_id=args.user) for w in workspaces]
+
+    for workspace, workspace_teams in zip(workspaces, all_teams_):
+        if not args.records:
+            _print_workspace_header(workspace)
+        _print_named_refs(
+            workspace_teams.result(),
+            records=args.records,
+            context={"workspace": workspace.name},
+        )
 
 
 def team(args):
@@ -103,11 +374,11 @@ def team(args):
     Get membership details for the specified team
     """
     asana = _new_asana_client(args)
-    team_id = to_team_id(args.team)
+    team_id = to_team_id(args.team or get_default_team())
 
     team_memberships = asana.get_team_members(team_id=team_id)
 
-    _print_named_refs([tm.user for tm in team_memberships])
+    _print_named_refs([tm.user for tm in team_memberships], records=args.records)
 
 
 def boards(args):
@@ -115,67 +386,429 @@ def boards(args):
     List the boards belonging to the specified team
     """
     asana = _new_asana_client(args)
-    team_id = to_team_id(args.team)
+    team_id = to_team_id(args.team or get_default_team())
 
     projects = asana.get_projects_by_team(team_id=team_id)
-    _print_named_refs(projects)
+    _print_named_refs(projects, records=args.records)
+
+
+def _get_board_identifiers(args) -> List[str]:
+    all_boards = get_all_boards()
+
+    if args.boards:
+        # Unknown (e.g. raw numeric) identifiers are kept in the order given, after configured ones
+        return sorted(
+            args.boards, key=lambda b: all_boards.index(b) if b in all_boards else len(all_boards)
+        )
+    elif args.all:
+        return all_boards
+    else:
+        default_board = get_default_board()
+        return [default_board] if default_board else []
+
+
+def _get_board_columns(board_config) -> List[str]:
+    columns_str = board_config.get("Columns")
+    return columns_str.split(",") if columns_str else []
 
 
 def board(args):
     """
-    Print details of the specified board
+    Print details of the specified boards
+
+    :param args:
+        boards: The board identifiers to print; defaults to the default board.
+        all: Whether to print all the boards in the configuration.
+        jobs: The maximum number of boards to fetch concurrently.
+        live: Whether to fetch boards from Asana in full even if there is a local snapshot (see
+            sync); otherwise, snapshots are brought up to date before they are printed. Boards
+            are always fetched in full if extra fields are asked for, as snapshots only keep the
+            fields needed to show them.
+        open: Whether to bypass CLI output and just open the boards in the browser.
+        watch: Whether to keep the boards on screen, updating them as they change.
+        interval: The initial (and minimum) number of seconds between checks for changes.
+        max_interval: The maximum number of seconds between checks for changes.
     """
+    import time
+
+    from requests import RequestException
+
+    from .asana.client import TASK_LIST_OPT_FIELDS
+    from .snapshot import load_snapshot, sync_board
 
     asana = _new_asana_client(args)
 
-    board_config = get_board_config(args.board)
+    board_identifiers = _get_board_identifiers(args)
+    board_configs = [get_board_config(b) for b in board_identifiers]
 
     if args.open:
         workspace = get_workspace()
-        os.system(f"open https://app.asana.com/1/{workspace}/project/{board_config['Id']}")
+        for board_config in board_configs:
+            os.system(f"open https://app.asana.com/1/{workspace}/project/{board_config['Id']}")
+    elif args.watch:
+        _watch_boards(
+            asana,
+            board_identifiers,
+            board_configs,
+            interval=args.interval or WATCH_INTERVAL,
+            max_interval=max(
+                args.interval or WATCH_INTERVAL, args.max_interval or WATCH_MAX_INTERVAL
+            ),
+            jobs=args.jobs or DEFAULT_JOBS,
+        )
     else:
-        tasks = asana.get_project_incomplete_tasks(project_id=board_config["Id"])
-        columns_str = board_config.get("Columns", fallback=None)
-        columns = columns_str.split(",") if columns_str else []
 
-        _print_tasks(tasks, section_id_allowlist=columns)
+        def _get_board(
+            board_config, *, stream: bool = False
+        ) -> Tuple[Sequence[Section] | None, Iterable[Task]]:
+            """
+            :param stream: Whether to return the tasks as they arrive rather than once they all
+                have, which is done when the board is the only one being fetched.
+            """
+            project_id = board_config["Id"]
+
+            if not (args.live or args.fields) and (snapshot := load_snapshot(project_id)):
+                # Bring the snapshot up to date first: a single request to the Events API if
+                # nothing changed. If that fails, the snapshot is printed as it is, saying so
+                try:
+                    snapshot, _ = sync_board(asana, project_id=project_id, snapshot=snapshot)
+                except RequestException as e:
+                    synced_at = time.strftime(
+                        "%Y-%m-%d %H:%M:%S", time.localtime(snapshot.synced_at)
+                    )
+                    print(
+                        f"{Fore.YELLOW}asa: failed to sync board {project_id} ({e}); showing it as "
+                        f"last synced at {synced_at}{Fore.RESET}",
+                        file=sys.stderr,
+                    )
+                return snapshot.sections or None, snapshot.tasks
+
+            sections = asana.get_sections_by_project(project_id=project_id)
+            opt_fields = _task_fields(args, TASK_LIST_OPT_FIELDS)
+
+            # Only the tasks in the configured columns are shown, so only those are fetched - a
+            # column at a time, in board order. The columns of a single board are fetched
+            # concurrently; when several boards are, the boards already are, so that no more than
+            # --jobs requests are in flight
+            if columns := _get_board_columns(board_config):
+
+                def _get_column(section_id: str) -> List[Task]:
+                    return asana.get_section_incomplete_tasks(
+                        section_id=section_id, opt_fields=opt_fields
+                    )
+
+                column_ids = [s.gid for s in sections if s.gid in columns]
+                tasks: Iterable[Task] = chain.from_iterable(
+                    _map_concurrently(
+                        _get_column, column_ids, max_workers=args.jobs or DEFAULT_JOBS
+                    )
+                    if stream
+                    else map(_get_column, column_ids)
+                )
+            else:
+                tasks = asana.iter_project_incomplete_tasks(
+                    project_id=project_id, opt_fields=opt_fields
+                )
+
+            return sections, tasks if stream else list(tasks)
+
+        # A single board is printed while its tasks are still arriving; several boards are each
+        # fetched in full concurrently, and printed in turn
+        all_boards = (
+            _map_concurrently(_get_board, board_configs, max_workers=args.jobs or DEFAULT_JOBS)
+            if len(board_configs) > 1
+            else (_get_board(board_config, stream=True) for board_config in board_configs)
+        )
+
+        for board_identifier, board_config, (sections, tasks) in zip(
+            board_identifiers, board_configs, all_boards
+        ):
+            if len(board_identifiers) > 1 and not args.records:
+                print(f"{Fore.MAGENTA}==> {board_identifier}{Fore.RESET}", flush=True)
+
+            _print_tasks(
+                tasks,
+                sections=sections,
+                section_id_allowlist=_get_board_columns(board_config),
+                records=args.records,
+                context={"board": board_identifier},
+                extra_fields=_extra_task_fields(args),
+            )
+
+
+def _redraw(previous: List[str], frame: List[str]) -> None:
+    """
+    Updates the terminal from showing the previous frame (one line per row, from the top) to
+    showing the given one, rewriting only the rows that differ.
+    """
+    out = []
+    for row, line in enumerate(frame):
+        if row >= len(previous) or line != previous[row]:
+            # Move to the start of the row, write the line and clear the rest of the row
+            out.append(f"\033[{row + 1};1H{line}\033[K")
+    if len(frame) < len(previous):
+        # Clear the rows below the frame
+        out.append(f"\033[{len(frame) + 1};1H\033[J")
+
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+
+
+def _watch_boards(
+    asana: AsanaClient,
+    board_identifiers: List[str],
+    board_configs: List[ConfigSection],
+    *,
+    interval: int,
+    max_interval: int,
+    jobs: int,
+):
+    """
+    Shows the boards until interrupted, checking for changes via their local snapshots (see sync),
+    so that each check costs a request to the Events API per board while nothing changes.
+
+    On a terminal, the boards are shown on the alternate screen, and only the lines that changed
+    are redrawn; otherwise, the boards are printed again whenever they change.
+    """
+    import io
+    import shutil
+    import time
+
+    from requests import RequestException
+
+    from .snapshot import sync_board
+
+    def _render(snapshots: List[BoardSnapshot]) -> List[str]:
+        out = io.StringIO()
+        for board_identifier, board_config, snapshot in zip(
+            board_identifiers, board_configs, snapshots
+        ):
+            if len(board_identifiers) > 1:
+                out.write(f"{Fore.MAGENTA}==> {board_identifier}{Fore.RESET}\n")
+            _print_tasks(
+                snapshot.tasks,
+                sections=snapshot.sections or None,
+                section_id_allowlist=_get_board_columns(board_config),
+                file=out,
+            )
+        return out.getvalue().splitlines()
+
+    on_terminal = sys.stdout.isatty()
+    if on_terminal:
+        # Switch to the alternate screen, hiding the cursor and turning off line wrapping (so that
+        # each line takes up exactly one row)
+        sys.stdout.write("\033[?1049h\033[?25l\033[?7l\033[2J")
+
+    board_lines: List[str] | None = None
+    shown: List[str] = []
+    terminal_size = None
+    delay = interval
+
+    try:
+        while True:
+            try:
+                results = list(
+                    _map_concurrently(
+                        lambda board_config: sync_board(asana, project_id=board_config["Id"]),
+                        board_configs,
+                        max_workers=jobs,
+                    )
+                )
+            except RequestException as e:
+                changed = False
+                status = f"{Fore.RED}failed to check for changes: {e}{Fore.RESET}"
+            else:
+                # Only changes that show up on the boards count (e.g. not new comments on tasks); a
+                # count of None means that the whole board was reloaded
+                changed = False
+                if board_lines is None or any(count != 0 for _, count in results):
+                    lines = _render([snapshot for snapshot, _ in results])
+                    changed, board_lines = lines != board_lines, lines
+                status = f"checked at {time.strftime('%H:%M:%S')}"
+
+            delay = interval if changed else min(delay * 2, max_interval)
+            status_line = f"{', '.join(board_identifiers)}: {status}, next check in {delay}s"
+
+            if on_terminal:
+                # Start afresh if the terminal was resized
+                if (size := shutil.get_terminal_size()) != terminal_size:
+                    terminal_size = size
+                    sys.stdout.write("\033[2J")
+                    shown = []
+
+                frame = [status_line, "", *(board_lines or [])][: size.lines]
+                _redraw(shown, frame)
+                shown = frame
+            elif changed:
+                print(status_line, *(board_lines or []), sep="\n", flush=True)
+
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if on_terminal:
+            sys.stdout.write("\033[?7h\033[?25h\033[?1049l")
+            sys.stdout.flush()
+
+
+def sync(args):
+    """
+    Bring the local snapshots of the specified boards up to date with Asana, fetching only the
+    tasks that changed since the last sync.
+
+    :param args:
+        boards: The board identifiers to sync; defaults to all the boards in the configuration.
+        jobs: The maximum number of boards to sync concurrently.
+    """
+    from .snapshot import sync_board
+
+    asana = _new_asana_client(args)
+
+    board_identifiers = _get_board_identifiers(args)
+    board_configs = [get_board_config(b) for b in board_identifiers]
+
+    results = _map_concurrently(
+        lambda board_config: sync_board(asana, project_id=board_config["Id"]),
+        board_configs,
+        max_workers=args.jobs or DEFAULT_JOBS,
+    )
+
+    for board_identifier, (snapshot, changed_count) in zip(board_identifiers, results):
+        if args.records:
+            # The changed count is null if the board was reloaded
+            args.records.write(
+                {"board": board_identifier, "tasks": len(snapshot.tasks), "changed": changed_count}
+            )
+            continue
+
+        print(
+            f"{board_identifier}: {len(snapshot.tasks)} tasks "
+            f"({'reloaded' if changed_count is None else f'{changed_count} changed'})"
+        )
+
+
+def _refresh_task_store(asana: AsanaClient, store: TaskStore, *, jobs: int) -> None:
+    project_ids = [to_board_id(b) for b in get_all_boards()]
+
+    all_tasks = _map_concurrently(
+        lambda project_id: asana.get_project_incomplete_tasks(project_id=project_id),
+        project_ids,
+        max_workers=jobs,
+    )
+
+    store.replace_tasks(dict(zip(project_ids, all_tasks)))
 
 
 def search_tasks(args):
     """
     Execute a text search for tasks.
+
+    :param args:
+        text: The text to search for.
+        boards: The boards to search; defaults to the default board (ignored when searching
+            locally).
+        all: Whether to search all the boards in the configuration.
+        jobs: The maximum number of boards to search concurrently.
+        local: Whether to search the local task store across all configured boards instead.
+        refresh_store: Whether to repopulate the local task store from Asana before searching.
     """
+    from .asana.client import TASK_LIST_OPT_FIELDS
+    from .store import TaskStore
+
     asana = _new_asana_client(args)
 
-    board_id = get_board_config(args.board)["Id"]
+    if args.local or args.refresh_store:
+        store = TaskStore()
+        try:
+            if args.refresh_store or store.refreshed_at() is None:
+                _refresh_task_store(asana, store, jobs=args.jobs or DEFAULT_JOBS)
+
+            project_ids = [to_board_id(b) for b in get_all_boards()]
+            tasks = store.search(args.text, project_ids=project_ids)
+        finally:
+            store.close()
+    elif len(board_identifiers := _get_board_identifiers(args)) > 1:
+        _search_boards(
+            asana, args, workspace_id=get_workspace(), board_identifiers=board_identifiers
+        )
+        return
+    else:
+        tasks = asana.iter_search_tasks(
+            workspace_id=get_workspace(),
+            search_text=args.text,
+            project_id=to_board_id(board_identifiers[0]),
+            opt_fields=_task_fields(args, TASK_LIST_OPT_FIELDS),
+        )
+
+    _print_tasks(tasks, records=args.records, extra_fields=_extra_task_fields(args))
 
-    tasks = asana.search_tasks(
-        workspace_id=get_workspace(), search_text=args.text, project_id=board_id
-    )
 
-    _print_tasks(tasks)
+def _search_boards(asana: AsanaClient, args, *, workspace_id: str, board_identifiers: List[str]):
+    """
+    Searches the boards concurrently, printing the tasks found on each board as soon as its search
+    completes. Tasks on several boards are only printed under the first of them to complete.
+    """
+    from .asana.client import TASK_LIST_OPT_FIELDS
+
+    opt_fields = _task_fields(args, TASK_LIST_OPT_FIELDS)
+
+    def _search(board_identifier: str) -> List[Task]:
+        return asana.search_tasks(
+            workspace_id=workspace_id,
+            search_text=args.text,
+            project_id=to_board_id(board_identifier),
+            opt_fields=opt_fields,
+        )
+
+    printed_task_ids: Set[str] = set()
+    for board_identifier, tasks in _map_as_completed(
+        _search, board_identifiers, max_workers=args.jobs or DEFAULT_JOBS
+    ):
+        new_tasks = [t for t in tasks if t.gid not in printed_task_ids]
+        printed_task_ids.update(t.gid for t in new_tasks)
+
+        if new_tasks and not args.records:
+            print(f"{Fore.MAGENTA}==> {board_identifier}{Fore.RESET}", flush=True)
+        _print_tasks(
+            new_tasks,
+            records=args.records,
+            context={"board": board_identifier},
+            extra_fields=_extra_task_fields(args),
+        )
 
 
 def manage_config(args) -> None:
     """
     Manage the asa configuration file.
     """
-    asana = _new_asana_client(args)
     config_file_path = os.path.expanduser(CONFIG_FILE_PATH)
 
     if args.init:
-        print(f"==> Preparing configuration to write to {CONFIG_FILE_PATH}...")
-        initialise_config(asana=asana, config_file_path=config_file_path)
+        # Records are written to stdout, so leave it to them
+        print(
+            f"==> Preparing configuration to write to {CONFIG_FILE_PATH}...",
+            file=sys.stderr if args.records else sys.stdout,
+        )
+        initialise_config(asana=_new_asana_client(args), config_file_path=config_file_path)
 
     reload_config()
 
-    print(f"==> Generated from the config file {config_file_path}")
-
     default_board = get_default_board()
     default_team = get_default_team()
     all_boards = get_all_boards()
     all_teams = get_all_teams()
 
+    if args.records:
+        for kind, names, default in (
+            ("team", all_teams, default_team),
+            ("board", all_boards, default_board),
+        ):
+            for name in names:
+                args.records.write({"kind": kind, "name": name, "default": name == default})
+        return
+
+    print(f"==> Generated from the config file {config_file_path}")
+
     print(f"{Fore.CYAN}Teams:{Fore.RESET}")
     for t in all_teams:
         print(f"  {t}{' [default]' if t == default_team else ''}")
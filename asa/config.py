@@ -1,20 +1,126 @@
-import configparser
+from __future__ import annotations
+
+import json
 import os
-import pathlib
 import re
+import tempfile
 from itertools import chain
-from typing import List
-
-import questionary
+from typing import TYPE_CHECKING, Dict, Iterable, List
 
-from asa.asana.client import AsanaClient
-from asa.asana.model import NamedRef, Workspace, Team, Project, Section
+if TYPE_CHECKING:
+    from asa.asana.client import AsanaClient
+    from asa.asana.model import NamedRef, Workspace, Team, Project, Section
 
 CONFIG_FILE_DIR = "~/.config/asa"
 CONFIG_FILE_PATH = f"{CONFIG_FILE_DIR}/config.ini"
 
-config = configparser.ConfigParser()
-config.read(os.path.expanduser(CONFIG_FILE_PATH))
+# Parsed copy of the config file, re-used for as long as the config file is not modified
+COMPILED_CONFIG_PATH = "~/.cache/asa/config.json"
+
+# Number of requests issued concurrently by the config wizard to fetch the options for its prompts
+WIZARD_PREFETCH_JOBS = 4
+
+
+class ConfigSection(dict):
+    """
+    The options in a section of the asa configuration. As in the config file itself, option names
+    are case-insensitive.
+    """
+
+    def __getitem__(self, option: str) -> str:
+        return super().__getitem__(option.lower())
+
+    def get(self, option: str, default: str | None = None) -> str | None:  # type: ignore[override]
+        return super().get(option.lower(), default)
+
+
+class _IndexedConfig:
+    """
+    The asa configuration along with indexes by name and gid of its typed (e.g. "board.<name>")
+    sections.
+    """
+
+    def __init__(self, sections: Dict[str, Dict[str, str]]):
+        self.sections = {name: ConfigSection(options) for name, options in sections.items()}
+        # e.g. "board" -> ["board_a", "board_b"]
+        self.names_by_type: Dict[str, List[str]] = {}
+        # e.g. "board" -> {"1234": "board.board_a"}
+        self.section_names_by_gid: Dict[str, Dict[str, str]] = {}
+
+        for section_name, options in self.sections.items():
+            section_type, _, name = section_name.partition(".")
+            if name:
+                self.names_by_type.setdefault(section_type, []).append(name)
+                if "id" in options:
+                    self.section_names_by_gid.setdefault(section_type, {}).setdefault(
+                        options["id"], section_name
+                    )
+
+    def get_by_gid(self, section_type: str, gid: str) -> ConfigSection | None:
+        section_name = self.section_names_by_gid.get(section_type, {}).get(gid)
+        return self.sections[section_name] if section_name else None
+
+
+_config: _IndexedConfig | None = None
+
+
+def _parse_config_file(config_file_path: str) -> Dict[str, Dict[str, str]]:
+    import configparser
+
+    config_parser = configparser.ConfigParser()
+    config_parser.read(config_file_path)
+
+    return {s: dict(config_parser[s]) for s in config_parser.sections()}
+
+
+def _load_config() -> _IndexedConfig:
+    """
+    Loads the asa configuration, using the compiled copy of the config file if it is up to date
+    and otherwise parsing the config file (and compiling it for next time).
+    """
+    config_file_path = os.path.expanduser(CONFIG_FILE_PATH)
+    compiled_config_path = os.path.expanduser(COMPILED_CONFIG_PATH)
+
+    try:
+        stat = os.stat(config_file_path)
+    except FileNotFoundError:
+        return _IndexedConfig({})
+
+    source = [config_file_path, stat.st_mtime_ns, stat.st_size]
+
+    try:
+        with open(compiled_config_path) as f:
+            compiled = json.load(f)
+        if compiled["source"] == source:
+            return _IndexedConfig(compiled["sections"])
+    except (OSError, ValueError, KeyError):
+        pass
+
+    sections = _parse_config_file(config_file_path)
+
+    try:
+        os.makedirs(os.path.dirname(compiled_config_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(compiled_config_path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"source": source, "sections": sections}, f)
+        os.replace(tmp_path, compiled_config_path)
+    except OSError:
+        # The compiled copy is only an optimisation
+        pass
+
+    return _IndexedConfig(sections)
+
+
+def _get_config() -> _IndexedConfig:
+    """
+    Returns the asa configuration, loading it on first use.
+    """
+    global _config
+
+    if _config is None:
+        _config = _load_config()
+
+    return _config
 
 
 #
@@ -22,50 +128,48 @@ config.read(os.path.expanduser(CONFIG_FILE_PATH))
 #
 
 
-def _get_config_by_id(id_: str, section_prefix: str):
-    for s in config.sections():
-        if s.startswith(f"{section_prefix}.") and config[s]["Id"] == id_:
-            yield config[s]
-
-
-def get_board_config(board_identifier: str):
+def get_board_config(board_identifier: str) -> ConfigSection | None:
     if board_identifier.isdigit():
-        return next(_get_config_by_id(board_identifier, "board"), None)
+        return _get_config().get_by_gid("board", board_identifier)
     else:
-        return config[f"board.{board_identifier}"]
+        return _get_config().sections[f"board.{board_identifier}"]
 
 
-def get_team_config(team_identifier: str):
+def get_team_config(team_identifier: str) -> ConfigSection | None:
     if team_identifier.isdigit():
-        return next(_get_config_by_id(team_identifier, "team"), None)
+        return _get_config().get_by_gid("team", team_identifier)
     else:
-        return config[f"team.{team_identifier}"]
+        return _get_config().sections[f"team.{team_identifier}"]
+
+
+def _get_default(option: str) -> str | None:
+    defaults = _get_config().sections.get("defaults")
+    return defaults[option] if defaults is not None else None
 
 
 def get_workspace() -> str | None:
-    return config["defaults"]["DefaultWorkspace"] if config.has_section("defaults") else None
+    return _get_default("DefaultWorkspace")
 
 
 def get_default_team() -> str | None:
-    return config["defaults"]["DefaultTeam"] if config.has_section("defaults") else None
+    return _get_default("DefaultTeam")
 
 
 def get_default_board() -> str | None:
-    return config["defaults"]["DefaultBoard"] if config.has_section("defaults") else None
+    return _get_default("DefaultBoard")
 
 
 def get_all_boards() -> List[str]:
-    section_names = config.sections()
-    return [re.sub("^board\\.", "", s) for s in section_names if s.startswith("board.")]
+    return list(_get_config().names_by_type.get("board", []))
 
 
 def get_all_teams() -> List[str]:
-    section_names = config.sections()
-    return [re.sub("^team\\.", "", s) for s in section_names if s.startswith("team.")]
+    return list(_get_config().names_by_type.get("team", []))
 
 
 def reload_config():
-    config.read(os.path.expanduser(CONFIG_FILE_PATH))
+    global _config
+    _config = _load_config()
 
 
 #
@@ -93,13 +197,51 @@ def to_board_id(board_name_or_id: str):
 #
 
 
-def initialise_config(*, asana: AsanaClient, config_file_path: str) -> None:
+def initialise_config(
+    *, asana: AsanaClient, config_file_path: str, max_workers: int = WIZARD_PREFETCH_JOBS
+) -> None:
     """
     Creates a asa config file based on the choices selected via wizard.
+
+    The options for each prompt are fetched in the background, on a pool of max_workers threads,
+    as soon as the options for the prompt before it are known: the teams in every workspace, the
+    projects of every team and the sections of every project (in one batch per team). Fetches for
+    options that were not chosen are cancelled if they have not started yet.
     """
+    import configparser
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    import questionary
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    teams_by_workspace: Dict[str, Future[List[Team]]] = {}
+    projects_by_team: Dict[str, Future[List[Project]]] = {}
+    # The sections of all the projects of a team are fetched together, so they share a future
+    sections_by_project: Dict[str, Future[Dict[str, List[Section]]]] = {}
+
+    def _fetch_sections(projects_: List[Project]) -> Dict[str, List[Section]]:
+        with asana.batch() as batch:
+            results = {p_.gid: batch.get_sections_by_project(project_id=p_.gid) for p_ in projects_}
+        return {gid: result.result() for gid, result in results.items()}
+
+    def _prefetch_projects(team_id: str) -> List[Project]:
+        projects_ = asana.get_projects_by_team(team_id=team_id)
+        sections = executor.submit(_fetch_sections, projects_)
+        for p_ in projects_:
+            sections_by_project[p_.gid] = sections
+        return projects_
+
+    def _cancel_unchosen(futures: Dict[str, Future], chosen: Iterable[NamedRef]) -> None:
+        chosen_futures = {futures[c.gid] for c in chosen if c.gid in futures}
+        for future in set(futures.values()) - chosen_futures:
+            future.cancel()
 
     def _choose_workspace() -> Workspace:
         workspaces = [wm.workspace for wm in asana.get_workspace_memberships(user_id="me")]
+        for w in workspaces:
+            teams_by_workspace[w.gid] = executor.submit(
+                asana.get_teams, workspace=w.gid, user_id="me"
+            )
 
         choices = [questionary.Choice(w.name, w) for w in workspaces]
         default_choice = next((c for c in choices if c.value == get_workspace()), None)
@@ -108,16 +250,22 @@ def initialise_config(*, asana: AsanaClient, config_file_path: str) -> None:
             "Which workspace do you want asa to work with?", choices=choices, default=default_choice
         ).ask()
 
+        _cancel_unchosen(teams_by_workspace, [workspace_])
         return workspace_
 
     def _choose_teams(workspace_id: str) -> List[Team]:
-        teams = asana.get_teams(workspace=workspace_id, user_id="me")
+        teams = teams_by_workspace[workspace_id].result()
+        for t in teams:
+            projects_by_team[t.gid] = executor.submit(_prefetch_projects, t.gid)
 
-        return questionary.checkbox(
+        teams_: List[Team] = questionary.checkbox(
             "Which teams do you want asa to work with?",
             choices=[questionary.Choice(t.name, t) for t in teams],
         ).ask()
 
+        _cancel_unchosen(projects_by_team, teams_)
+        return teams_
+
     def _choose_default_team(teams_: List[Team]) -> Team:
         return questionary.select(
             "Which team do you wish to be the default?",
@@ -125,7 +273,7 @@ def initialise_config(*, asana: AsanaClient, config_file_path: str) -> None:
         ).ask()
 
     def _choose_projects(team: Team) -> List[Project]:
-        projects_ = asana.get_projects_by_team(team_id=team.gid)
+        projects_ = projects_by_team[team.gid].result()
 
         if len(projects_) > 0:
             return questionary.checkbox(
@@ -142,7 +290,7 @@ def initialise_config(*, asana: AsanaClient, config_file_path: str) -> None:
         ).ask()
 
     def _choose_sections(project: Project) -> List[Section]:
-        sections_ = asana.get_sections_by_project(project_id=project.gid)
+        sections_ = sections_by_project[project.gid].result()[project.gid]
 
         return questionary.checkbox(
             f"Board: '{project.name}': which columns do you want asa to display for this board by default?",
@@ -152,15 +300,22 @@ def initialise_config(*, asana: AsanaClient, config_file_path: str) -> None:
     def _name_to_config_key(name: str):
         return re.sub("[^a-z_]", "", name.strip().lower().replace(" ", "_"))
 
-    workspace: NamedRef = _choose_workspace()
+    try:
+        workspace: NamedRef = _choose_workspace()
+
+        selected_teams: List[Team] = _choose_teams(workspace_id=workspace.gid)
+        default_team: NamedRef = _choose_default_team(selected_teams)
 
-    selected_teams: List[Team] = _choose_teams(workspace_id=workspace.gid)
-    default_team: NamedRef = _choose_default_team(selected_teams)
+        selected_projects: List[Project] = list(
+            chain.from_iterable([_choose_projects(t) for t in selected_teams])
+        )
+        _cancel_unchosen(sections_by_project, selected_projects)
+        default_board = _choose_default_board(selected_projects)
 
-    selected_projects: List[Project] = list(
-        chain.from_iterable([_choose_projects(t) for t in selected_teams])
-    )
-    default_board = _choose_default_board(selected_projects)
+        sections_by_selected_project = {p.gid: _choose_sections(p) for p in selected_projects}
+    finally:
+        # Don't wait for prefetches that are no longer needed (e.g. if the wizard was aborted)
+        executor.shutdown(wait=False, cancel_futures=True)
 
     config_parser = configparser.ConfigParser()
     config_parser.optionxform = str  # type: ignore
@@ -175,13 +330,13 @@ def initialise_config(*, asana: AsanaClient, config_file_path: str) -> None:
         config_parser[f"team.{_name_to_config_key(t.name)}"] = {"Id": t.gid}
 
     for p in selected_projects:
-        sections = _choose_sections(p)
+        sections = sections_by_selected_project[p.gid]
         config_parser[f"board.{_name_to_config_key(p.name)}"] = {
             "Id": p.gid,
             "Columns": ",".join([s.gid for s in sections]),
         }
 
-    os.makedirs(pathlib.Path(config_file_path).parent.resolve(), exist_ok=True)
+    os.makedirs(os.path.dirname(os.path.abspath(config_file_path)), exist_ok=True)
 
     with open(config_file_path, "w") as config_file:
         config_parser.write(config_file)
@@ -0,0 +1,257 @@
+"""
+A long-running asa process that runs commands on behalf of the `asa` front end, so that they don't
+each pay for starting the interpreter, importing asa's dependencies and opening new connections.
+
+The front end sends the command line to the daemon over a Unix domain socket and writes out the
+output streamed back to it. Messages in both directions are framed as a one byte kind, a four byte
+(big-endian) length and a payload:
+
+- front end to daemon: "r" with the request as JSON (the arguments, the access token and the
+  environment variables that asa depends on)
+- daemon to front end: "o" and "e" with output to write to stdout and stderr, then "x" with the
+  exit code as JSON - or just "n" if the daemon cannot run the command, as the front end's
+  environment differs from its own, in which case the front end runs it itself
+
+Note that only the (cheap) standard library modules needed to forward commands are imported at the
+top level, and socket only once there is a daemon to forward to, as this module is imported by the
+front end on every run.
+"""
+
+import json
+import os
+import struct
+import sys
+from io import BufferedIOBase
+from typing import Any, Dict, List, Tuple
+
+SOCKET_PATH = "~/.cache/asa/daemon.sock"
+
+_HEADER = struct.Struct(">cI")
+
+# Environment variables that change what commands do - other than ASANA_TOKEN, which is sent with
+# each request - and so must match between the front end and the daemon for it to run a command
+# (e.g. the API base is read once, on import, and proxies by requests from the daemon's environment)
+_ENVIRONMENT = (
+    "ASANA_API_BASE",
+    "HOME",
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "NO_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "no_proxy",
+    "REQUESTS_CA_BUNDLE",
+    "CURL_CA_BUNDLE",
+)
+
+
+def _environment() -> Dict[str, str | None]:
+    return {name: os.environ.get(name) for name in _ENVIRONMENT}
+
+
+def _socket_path() -> str:
+    return os.path.expanduser(SOCKET_PATH)
+
+
+def _write_frame(f: BufferedIOBase, kind: bytes, payload: bytes) -> None:
+    f.write(_HEADER.pack(kind, len(payload)) + payload)
+    f.flush()
+
+
+def _read_frame(f: BufferedIOBase) -> Tuple[bytes, bytes] | None:
+    if len(header := f.read(_HEADER.size)) < _HEADER.size:
+        return None
+    kind, length = _HEADER.unpack(header)
+    return kind, f.read(length)
+
+
+#
+# Front end
+#
+
+
+def forward(argv: List[str]) -> int | None:
+    """
+    Runs the command on the daemon, if it is running, writing out its output as it arrives.
+
+    :return: The exit code of the command, or None if the daemon is not running or cannot run the
+        command in this environment.
+    """
+    if not os.path.exists(socket_path := _socket_path()):
+        return None
+
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+
+    request = {
+        "argv": argv,
+        "token": os.environ.get("ASANA_TOKEN"),
+        "environment": _environment(),
+        "isatty": {"stdout": sys.stdout.isatty(), "stderr": sys.stderr.isatty()},
+    }
+
+    with sock, sock.makefile("rwb") as f:
+        _write_frame(f, b"r", json.dumps(request).encode())
+
+        streams = {b"o": sys.stdout.buffer, b"e": sys.stderr.buffer}
+        while frame := _read_frame(f):
+            kind, payload = frame
+            if kind == b"x":
+                return json.loads(payload)
+            if kind == b"n":
+                return None
+            streams[kind].write(payload)
+            streams[kind].flush()
+
+    # The daemon went away mid-command
+    print("asa: lost the connection to the daemon", file=sys.stderr)
+    return 1
+
+
+#
+# Daemon
+#
+
+
+class _FrameWriter:
+    """
+    Text stream that sends what is written to it to the front end as frames of the given kind.
+    """
+
+    def __init__(self, f: BufferedIOBase, kind: bytes, *, isatty: bool):
+        self.f = f
+        self.kind = kind
+        self._isatty = isatty
+
+    def write(self, s: str) -> int:
+        if s:
+            _write_frame(self.f, self.kind, s.encode())
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return self._isatty
+
+    @property
+    def closed(self) -> bool:
+        return False
+
+
+def _run(request: Any, f: BufferedIOBase) -> int:
+    """
+    Runs the requested command with its output sent to the front end, returning its exit code.
+    """
+    import traceback
+
+    import colorama
+
+    from asa import cli
+    from asa.config import reload_config
+
+    # As colorama.init() does for the front end's own streams, strip colours if the front end's
+    # output is not a terminal
+    stdout = colorama.AnsiToWin32(
+        _FrameWriter(f, b"o", isatty=request["isatty"]["stdout"])  # type: ignore[arg-type]
+    ).stream
+    stderr = colorama.AnsiToWin32(
+        _FrameWriter(f, b"e", isatty=request["isatty"]["stderr"])  # type: ignore[arg-type]
+    ).stream
+
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        args = cli.build_parser().parse_args(request["argv"])
+        args.token = args.token or request["token"]
+
+        # The config file may have changed since the last command
+        reload_config()
+
+        cli.run_command(args)
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+
+
+def serve() -> None:
+    """
+    Runs commands sent by the front end until interrupted. Commands are run one at a time, as
+    their output is captured by swapping out sys.stdout and sys.stderr.
+    """
+    import signal
+    import socket
+    import socketserver
+    import threading
+
+    socket_path = _socket_path()
+    lock = threading.Lock()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            if not (frame := _read_frame(self.rfile)) or frame[0] != b"r":
+                return
+
+            request = json.loads(frame[1])
+            if request.get("environment") != _environment():
+                try:
+                    _write_frame(self.wfile, b"n", b"")
+                except OSError:
+                    pass
+                return
+
+            with lock:
+                try:
+                    exit_code = _run(request, self.wfile)
+                    _write_frame(self.wfile, b"x", json.dumps(exit_code).encode())
+                except OSError:
+                    # The front end went away (e.g. it was interrupted)
+                    pass
+
+    # Remove the socket left behind by a daemon that did not exit cleanly, unless it is still
+    # running
+    if in_use := os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            in_use = False
+            os.remove(socket_path)
+        finally:
+            probe.close()
+    if in_use:
+        print(f"asa: a daemon is already listening on {socket_path}", file=sys.stderr)
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    old_umask = os.umask(0o077)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+
+    # Also stop (removing the socket) when terminated, e.g. by a service manager
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    print(f"==> Listening on {socket_path} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(socket_path)
@@ -0,0 +1,114 @@
+"""
+Writers for the machine-readable output formats (see --format), which commands use instead of
+their usual coloured text. Commands write one record (a flat dict) at a time, as they produce them,
+and each record is written out straight away so that scripts can process long lists as they
+arrive:
+
+- json: a single array of records
+- ndjson: one record per line
+- tsv: a header row of the first record's keys, then one row per record
+
+Values that are models (e.g. fields asked for with --fields) are written as JSON objects.
+"""
+
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, TextIO
+
+OUTPUT_FORMATS = ("text", "json", "ndjson", "tsv")
+
+type Record = Dict[str, Any]
+
+
+def _to_json(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", exclude_unset=True)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_to_json, ensure_ascii=False)
+
+
+class RecordWriter(ABC):
+    """
+    Writes records to a file (stdout by default) in one of the machine-readable formats.
+    """
+
+    def __init__(self, file: TextIO | None = None):
+        self.file = file if file is not None else sys.stdout
+
+    @abstractmethod
+    def write(self, record: Record) -> None:
+        pass
+
+    def close(self) -> None:
+        """
+        Finishes the output, once the command has written all its records.
+        """
+        pass
+
+    def _write(self, s: str) -> None:
+        self.file.write(s)
+        self.file.flush()
+
+
+class JsonWriter(RecordWriter):
+    def __init__(self, file: TextIO | None = None):
+        super().__init__(file)
+        self._count = 0
+
+    def write(self, record: Record) -> None:
+        self._write(f"{',' if self._count else '['}\n{_dumps(record)}")
+        self._count += 1
+
+    def close(self) -> None:
+        self._write("\n]\n" if self._count else "[]\n")
+
+
+class NdjsonWriter(RecordWriter):
+    def write(self, record: Record) -> None:
+        self._write(f"{_dumps(record)}\n")
+
+
+class TsvWriter(RecordWriter):
+    """
+    Writes tab-separated values, with tabs, newlines and backslashes in values escaped with
+    backslashes. Missing values and nulls are written as empty strings.
+    """
+
+    _ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+    def __init__(self, file: TextIO | None = None):
+        super().__init__(file)
+        self._columns: List[str] | None = None
+
+    def write(self, record: Record) -> None:
+        if self._columns is None:
+            self._columns = list(record)
+            self._write(self._to_row(self._columns))
+        self._write(self._to_row([record.get(column) for column in self._columns]))
+
+    @classmethod
+    def _to_row(cls, values: List[Any]) -> str:
+        return "\t".join(cls._to_cell(v) for v in values) + "\n"
+
+    @classmethod
+    def _to_cell(cls, value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if not isinstance(value, (str, int, float)):
+            value = _dumps(value)
+        return str(value).translate(cls._ESCAPES)
+
+
+def new_record_writer(output_format: str, file: TextIO | None = None) -> RecordWriter:
+    writers: Dict[str, type[JsonWriter | NdjsonWriter | TsvWriter]] = {
+        "json": JsonWriter,
+        "ndjson": NdjsonWriter,
+        "tsv": TsvWriter,
+    }
+    return writers[output_format](file)
@@ -0,0 +1,152 @@
+import os
+import tempfile
+import time
+from typing import Dict, Tuple
+
+from pydantic import ValidationError
+
+from asa.asana.batch import BatchActionError
+from asa.asana.cache import CACHE_DIR
+from asa.asana.client import TASK_LIST_OPT_FIELDS, AsanaClient, SyncTokenExpiredError
+from asa.asana.model import BaseModel, Section, Task
+
+SNAPSHOT_DIR = f"{CACHE_DIR}/boards"
+
+
+class BoardSnapshot(BaseModel):
+    """
+    A local copy of the sections and incomplete tasks on a board, along with the Events API sync
+    token from which changes made since the snapshot was taken can be read. Only the task fields
+    needed to show the board are kept (see TASK_LIST_OPT_FIELDS).
+    """
+
+    project_id: str
+    sync: str
+    synced_at: float
+    sections: Tuple[Section, ...] = ()
+    tasks: Tuple[Task, ...]
+
+
+def _snapshot_path(project_id: str) -> str:
+    return os.path.join(os.path.expanduser(SNAPSHOT_DIR), f"{project_id}.json")
+
+
+def load_snapshot(project_id: str) -> BoardSnapshot | None:
+    try:
+        with open(_snapshot_path(project_id), "rb") as f:
+            return BoardSnapshot.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return None
+
+
+def save_snapshot(snapshot: BoardSnapshot) -> None:
+    snapshot_path = _snapshot_path(snapshot.project_id)
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(snapshot_path), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(snapshot.model_dump_json())
+    os.replace(tmp_path, snapshot_path)
+
+
+def _reload_board(asana: AsanaClient, *, project_id: str, sync: str | None) -> BoardSnapshot:
+    if sync is None:
+        try:
+            _, sync = asana.get_events(resource_id=project_id, sync=None)
+        except SyncTokenExpiredError as e:
+            sync = e.sync
+
+    # The sync token is obtained before the tasks are read so that no change made in between is
+    # missed on the next sync. The sections are read afresh rather than from the response cache,
+    # which could be missing columns added since they were cached
+    sections = asana.get_sections_by_project(project_id=project_id, refresh=True)
+    tasks = asana.get_project_incomplete_tasks(
+        project_id=project_id, opt_fields=TASK_LIST_OPT_FIELDS
+    )
+
+    return BoardSnapshot(
+        project_id=project_id,
+        sync=sync,
+        synced_at=time.time(),
+        sections=tuple(sections),
+        tasks=tuple(tasks),
+    )
+
+
+def sync_board(
+    asana: AsanaClient, *, project_id: str, snapshot: BoardSnapshot | None = None
+) -> Tuple[BoardSnapshot, int | None]:
+    """
+    Brings the local snapshot of the board up to date and saves it. Only the tasks that changed
+    since the last sync are fetched; the whole board is reloaded if there is no snapshot yet or
+    its sync token has expired.
+
+    :param snapshot: The local snapshot of the board, if the caller has already loaded it.
+    :return: The updated snapshot, along with the number of changed tasks that were fetched (or
+        None if the whole board was reloaded).
+    """
+    snapshot = snapshot or load_snapshot(project_id)
+    changed_count: int | None = None
+
+    if snapshot is None:
+        snapshot = _reload_board(asana, project_id=project_id, sync=None)
+    else:
+        try:
+            events, sync = asana.get_events(resource_id=project_id, sync=snapshot.sync)
+        except SyncTokenExpiredError as e:
+            snapshot = _reload_board(asana, project_id=project_id, sync=e.sync)
+        else:
+            changed_task_ids = list(
+                dict.fromkeys(e.resource.gid for e in events if e.resource.resource_type == "task")
+            )
+            tasks: Dict[str, Task] = {t.gid: t for t in snapshot.tasks}
+
+            # The changed tasks (and the sections, if they are re-read) are fetched together via
+            # the Batch API - a request per MAX_BATCH_ACTIONS of them rather than one each. The
+            # sections are only re-read if something other than a task changed (e.g. a section was
+            # added or renamed), so that polling an unchanged board is a single request - and then
+            # from Asana rather than the response cache, which would still have the old ones
+            with asana.batch() as batch:
+                # (A bare "projects" would only give the gid of each project, which is not enough
+                # to validate it as a Project)
+                changed_tasks = [
+                    batch.get_task(
+                        task_id=task_id,
+                        opt_fields=f"{TASK_LIST_OPT_FIELDS},projects.name,completed",
+                    )
+                    for task_id in changed_task_ids
+                ]
+                changed_sections = (
+                    batch.get_sections_by_project(project_id=project_id, refresh=True)
+                    if any(e.resource.resource_type != "task" for e in events)
+                    else None
+                )
+
+            for task_id, result in zip(changed_task_ids, changed_tasks):
+                try:
+                    task = result.result()
+                except BatchActionError as e:
+                    if e.status_code == 404:
+                        tasks.pop(task_id, None)
+                        continue
+                    raise
+
+                if task.completed or project_id not in (p.gid for p in task.projects):
+                    tasks.pop(task_id, None)
+                else:
+                    tasks[task_id] = task
+
+            sections = tuple(changed_sections.result()) if changed_sections else snapshot.sections
+
+            snapshot = BoardSnapshot(
+                project_id=project_id,
+                sync=sync,
+                synced_at=time.time(),
+                sections=sections,
+                tasks=tuple(tasks.values()),
+            )
+            changed_count = len(changed_task_ids)
+
+    save_snapshot(snapshot)
+
+    return snapshot, changed_count
@@ -0,0 +1,200 @@
+import os
+import re
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Sequence
+
+from asa.asana.cache import CACHE_DIR
+from asa.asana.model import Project, Section, Task, UserCompact, Workspace
+
+STORE_PATH = f"{CACHE_DIR}/tasks.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS projects (gid TEXT PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sections (gid TEXT PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS users (gid TEXT PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    gid TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    permalink_url TEXT,
+    assignee_gid TEXT REFERENCES users (gid),
+    workspace_gid TEXT NOT NULL,
+    workspace_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_projects (
+    task_gid TEXT NOT NULL,
+    project_gid TEXT NOT NULL REFERENCES projects (gid),
+    PRIMARY KEY (task_gid, project_gid)
+);
+CREATE INDEX IF NOT EXISTS task_projects_by_project ON task_projects (project_gid);
+CREATE TABLE IF NOT EXISTS task_sections (
+    task_gid TEXT NOT NULL,
+    section_gid TEXT NOT NULL REFERENCES sections (gid),
+    PRIMARY KEY (task_gid, section_gid)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    name, content='tasks', content_rowid='id', tokenize='unicode61'
+);
+"""
+
+
+class TaskStore:
+    """
+    Local SQLite database of the tasks on boards, with a full-text (FTS5) index on task names so
+    that they can be searched offline.
+    """
+
+    def __init__(self, path: str = STORE_PATH):
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def refreshed_at(self) -> float | None:
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'refreshed_at'"
+        ).fetchone()
+        return float(row[0]) if row else None
+
+    def replace_tasks(self, tasks_by_project: Dict[str, Iterable[Task]]) -> None:
+        """
+        Replaces the stored tasks of each of the given projects in a single transaction, then
+        rebuilds the full-text index.
+        """
+        with self.connection as c:
+            for project_id, tasks in tasks_by_project.items():
+                c.execute("DELETE FROM task_projects WHERE project_gid = ?", (project_id,))
+
+                for task in tasks:
+                    self._upsert_task(c, task)
+                    c.execute(
+                        "INSERT OR IGNORE INTO task_projects (task_gid, project_gid) VALUES (?, ?)",
+                        (task.gid, project_id),
+                    )
+
+            # Drop tasks that are no longer on any of the stored boards
+            c.execute("DELETE FROM tasks WHERE gid NOT IN (SELECT task_gid FROM task_projects)")
+            c.execute("DELETE FROM task_sections WHERE task_gid NOT IN (SELECT gid FROM tasks)")
+            c.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+            c.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)",
+                (str(time.time()),),
+            )
+
+    @staticmethod
+    def _upsert_task(c: sqlite3.Connection, task: Task) -> None:
+        if task.workspace is None:
+            raise ValueError(f"Task {task.gid} was fetched without its workspace (see opt_fields)")
+
+        if task.assignee:
+            c.execute(
+                "INSERT OR REPLACE INTO users (gid, name) VALUES (?, ?)",
+                (task.assignee.gid, task.assignee.name),
+            )
+
+        c.execute(
+            "INSERT INTO tasks "
+            "(gid, name, permalink_url, assignee_gid, workspace_gid, workspace_name) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (gid) DO UPDATE SET name = excluded.name, "
+            "permalink_url = excluded.permalink_url, assignee_gid = excluded.assignee_gid",
+            (
+                task.gid,
+                task.name,
+                task.permalink_url,
+                task.assignee.gid if task.assignee else None,
+                task.workspace.gid,
+                task.workspace.name,
+            ),
+        )
+
+        # Only project names are kept here: tasks are linked to the boards they were stored for
+        for project in task.projects:
+            c.execute(
+                "INSERT OR REPLACE INTO projects (gid, name) VALUES (?, ?)",
+                (project.gid, project.name),
+            )
+
+        c.execute("DELETE FROM task_sections WHERE task_gid = ?", (task.gid,))
+        for section in task.sections:
+            c.execute(
+                "INSERT OR REPLACE INTO sections (gid, name) VALUES (?, ?)",
+                (section.gid, section.name),
+            )
+            c.execute(
+                "INSERT OR IGNORE INTO task_sections (task_gid, section_gid) VALUES (?, ?)",
+                (task.gid, section.gid),
+            )
+
+    def search(self, text: str, *, project_ids: Sequence[str]) -> List[Task]:
+        """
+        Returns the stored tasks on any of the given projects whose names contain words starting
+        with each of the words in the search text, best matches first.
+        """
+        # Quote each word so that FTS5 query syntax in the search text is matched literally
+        words = re.findall(r"\w+", text)
+        if not words or not project_ids:
+            return []
+        query = " ".join(f'"{w}"*' for w in words)
+
+        rows = self.connection.execute(
+            f"""
+            SELECT t.gid, t.name, t.permalink_url, u.gid, u.name, t.workspace_gid, t.workspace_name
+            FROM tasks_fts
+            JOIN tasks t ON t.id = tasks_fts.rowid
+            LEFT JOIN users u ON u.gid = t.assignee_gid
+            WHERE tasks_fts MATCH ?
+            AND t.gid IN (
+                SELECT task_gid FROM task_projects
+                WHERE project_gid IN ({",".join("?" * len(project_ids))})
+            )
+            ORDER BY tasks_fts.rank
+            """,
+            (query, *project_ids),
+        ).fetchall()
+
+        return [self._to_task(*row) for row in rows]
+
+    def _to_task(
+        self,
+        gid: str,
+        name: str,
+        permalink_url: str | None,
+        assignee_gid: str | None,
+        assignee_name: str | None,
+        workspace_gid: str,
+        workspace_name: str,
+    ) -> Task:
+        sections = self.connection.execute(
+            "SELECT s.gid, s.name FROM task_sections ts JOIN sections s ON s.gid = ts.section_gid "
+            "WHERE ts.task_gid = ?",
+            (gid,),
+        ).fetchall()
+        projects = self.connection.execute(
+            "SELECT p.gid, p.name FROM task_projects tp JOIN projects p ON p.gid = tp.project_gid "
+            "WHERE tp.task_gid = ?",
+            (gid,),
+        ).fetchall()
+
+        return Task(
+            gid=gid,
+            name=name,
+            permalink_url=permalink_url,
+            assignee=(
+                UserCompact(gid=assignee_gid, name=assignee_name)
+                if assignee_gid and assignee_name
+                else None
+            ),
+            memberships=tuple(
+                Task.Membership(section=Section(gid=s_gid, name=s_name))
+                for s_gid, s_name in sections
+            ),
+            projects=tuple(Project(gid=p_gid, name=p_name) for p_gid, p_name in projects),
+            workspace=Workspace(gid=workspace_gid, name=workspace_name),
+        )
@@ -0,0 +1,133 @@
+"""
+Benchmarks asa commands end to end against a local stub of the Asana API (see stub_server.py).
+
+The config wizard is run first (with its prompts answered automatically, see wizard_driver.py) to
+write a config for the synthetic data; then each command is run in its own process a number of
+times. For each command, the median wall time and the request count, bytes received and peak RSS
+of the run are reported. Unless --warm is given, the response cache and board snapshots are
+cleared before every run, so that each run talks to the API as on first use.
+
+Usage: python benchmarks/bench_cli.py [--runs N] [--warm] [--json] [sizes...]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from stub_server import StubServer, add_size_arguments, data_from_args
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WIZARD_DRIVER = os.path.join(REPO_DIR, "benchmarks", "wizard_driver.py")
+
+# Commands are run with their defaults (e.g. the client-side rate limit), as users run them
+ASA = [sys.executable, "-m", "asa"]
+
+
+def _scenarios(search_text: str) -> Dict[str, List[str]]:
+    return {
+        "config --init": [sys.executable, WIZARD_DRIVER, "config", "--init"],
+        "me": [*ASA, "me"],
+        "boards": [*ASA, "boards"],
+        "board": [*ASA, "board"],
+        "board --all": [*ASA, "board", "--all"],
+        "search": [*ASA, "search", search_text],
+    }
+
+
+def _run(argv: List[str], *, server: StubServer, env: Dict[str, str]) -> Dict[str, float]:
+    """
+    Runs the command to completion, returning its wall time, the requests and bytes it received
+    from the server, and its peak RSS.
+    """
+    server.reset_stats()
+
+    with tempfile.TemporaryFile() as stderr:
+        started_at = time.perf_counter()
+        process = subprocess.Popen(
+            argv, cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=stderr
+        )
+        # wait4 (unlike Popen.wait) also returns the resource usage of the process
+        _, status, rusage = os.wait4(process.pid, 0)
+        wall_seconds = time.perf_counter() - started_at
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        if process.returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(
+                f"{' '.join(argv)} exited with {process.returncode}:\n"
+                f"{stderr.read().decode(errors='replace')}"
+            )
+
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS
+    peak_rss = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+    return {
+        "wall_seconds": wall_seconds,
+        "requests": server.requests,
+        "bytes": server.bytes_sent,
+        "peak_rss_bytes": peak_rss,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark asa commands against a stub API")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per command (default: 3)")
+    parser.add_argument("--warm", action="store_true", help="Keep caches between runs")
+    parser.add_argument("--search-text", default="review", help="Text to search for")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    add_size_arguments(parser)
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+
+    with (
+        tempfile.TemporaryDirectory() as home,
+        StubServer(data_from_args(args), latency=args.latency_ms / 1000) as server,
+    ):
+        env = {
+            **os.environ,
+            "HOME": home,
+            "ASANA_API_BASE": server.url,
+            "ASANA_TOKEN": "bench",
+            "PYTHONPATH": os.pathsep.join(filter(None, [REPO_DIR, os.environ.get("PYTHONPATH")])),
+        }
+
+        for name, argv in _scenarios(args.search_text).items():
+            runs = []
+            for _ in range(args.runs):
+                if not args.warm:
+                    shutil.rmtree(os.path.join(home, ".cache"), ignore_errors=True)
+                runs.append(_run(argv, server=server, env=env))
+
+            results.append(
+                {
+                    "command": name,
+                    "wall_seconds": statistics.median(r["wall_seconds"] for r in runs),
+                    "requests": runs[-1]["requests"],
+                    "bytes": runs[-1]["bytes"],
+                    "peak_rss_bytes": max(r["peak_rss_bytes"] for r in runs),
+                }
+            )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'command':<16} {'wall':>9} {'requests':>9} {'received':>11} {'peak RSS':>9}")
+        for r in results:
+            print(
+                f"{r['command']:<16} {r['wall_seconds'] * 1000:>7.0f}ms {r['requests']:>9}"
+                f" {r['bytes'] / 1024:>9.1f}KB {r['peak_rss_bytes'] / 1024 / 1024:>7.1f}MB"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
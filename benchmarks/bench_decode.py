@@ -0,0 +1,126 @@
+"""
+Compares ways of decoding a page of tasks as returned by the Asana API:
+
+- per-item (smart union): json.loads the body, then model_validate each item, with memberships
+  validated as a union of project and section memberships (how pages used to be decoded)
+- per-item: as above, with the current Task model
+- bulk: Page[Task].model_validate_json over the raw body, in a single pass
+- bulk (interned): as above, with the workspaces, projects, sections and assignees then interned,
+  as AsanaClient does with intern_refs (see IdentityMap)
+- streamed: item by item as the body arrives in chunks, as with --stream (see PageStream)
+
+Usage: python benchmarks/bench_decode.py [--tasks N] [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from asa.asana.model import (
+    BaseModel,
+    Page,
+    IdentityMap,
+    Project,
+    Section,
+    Task,
+    UserCompact,
+    Workspace,
+)
+from asa.asana.streaming import STREAM_CHUNK_SIZE, PageStream
+
+
+class ProjectMembership(BaseModel):
+    project: Project
+
+
+class SectionMembership(BaseModel):
+    section: Section
+
+
+class SmartUnionTask(BaseModel):
+    gid: str
+    name: str
+    permalink_url: Optional[str] = None
+    assignee: Optional[UserCompact]
+    memberships: Tuple[ProjectMembership | SectionMembership, ...]
+    projects: Tuple[Project, ...]
+    workspace: Workspace
+
+
+def _make_body(task_count: int) -> bytes:
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "gid": str(1200000000000000 + i),
+                    "name": f"Task number {i} with a reasonably long name",
+                    "permalink_url": f"https://app.asana.com/0/1/{i}",
+                    "assignee": {"gid": str(i % 7), "name": "Ada Lovelace"},
+                    "memberships": [{"section": {"gid": str(i % 5), "name": f"Column {i % 5}"}}],
+                    "projects": [{"gid": "1", "name": "Board"}],
+                    "workspace": {"gid": "2", "name": "Workspace"},
+                }
+                for i in range(task_count)
+            ],
+            "next_page": {
+                "offset": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9",
+                "path": "/",
+                "uri": "/",
+            },
+        }
+    ).encode()
+
+
+def _per_item(model: type[BaseModel]) -> Callable[[bytes], List]:
+    def decode(body: bytes) -> List:
+        return [model.model_validate(item) for item in json.loads(body)["data"]]
+
+    return decode
+
+
+def _bulk(body: bytes) -> List[Task]:
+    return Page[Task].model_validate_json(body).data
+
+
+def _bulk_interned(body: bytes) -> List[Task]:
+    return IdentityMap().intern(Page[Task].model_validate_json(body)).data
+
+
+def _streamed(body: bytes) -> List[Task]:
+    chunks = (body[i : i + STREAM_CHUNK_SIZE] for i in range(0, len(body), STREAM_CHUNK_SIZE))
+    return list(PageStream(chunks, Task.model_validate))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark decoding of task pages")
+    parser.add_argument("--tasks", type=int, default=100, help="Tasks per page (default: 100)")
+    parser.add_argument("--repeat", type=int, default=200, help="Pages decoded per run")
+    args = parser.parse_args()
+
+    body = _make_body(args.tasks)
+    decoders: Dict[str, Callable[[bytes], List]] = {
+        "per-item (smart union)": _per_item(SmartUnionTask),
+        "per-item": _per_item(Task),
+        "bulk": _bulk,
+        "bulk (interned)": _bulk_interned,
+        "streamed": _streamed,
+    }
+
+    # Check that every decoder finds the section of each task before timing them
+    for decode in decoders.values():
+        tasks = decode(body)
+        assert len(tasks) == args.tasks
+        assert all(isinstance(m.section, Section) for t in tasks for m in t.memberships)
+
+    print(f"{args.tasks} tasks per page ({len(body)} bytes), best of 5 x {args.repeat} pages")
+    baseline = None
+    for name, decode in decoders.items():
+        seconds = min(timeit.repeat(lambda: decode(body), number=args.repeat, repeat=5))
+        per_page_us = seconds / args.repeat * 1e6
+        baseline = baseline or per_page_us
+        print(f"  {name:<24} {per_page_us:>9.1f} us/page  {baseline / per_page_us:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
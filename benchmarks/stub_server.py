@@ -0,0 +1,389 @@
+"""
+Local stand-in for the Asana API, serving synthetic workspaces, teams, projects, sections and tasks
+so that asa can be benchmarked end to end without touching a real Asana account.
+
+Only the endpoints used by asa (including the Batch API, for GET actions) are served, returning
+only the fields asked for in opt_fields as the API does. Each response is delayed by a fixed
+latency, and the number of requests served and bytes sent are counted.
+
+Usage: python benchmarks/stub_server.py [--port PORT] [--latency-ms MS] [sizes...]
+Then run asa with ASANA_API_BASE set to the URL printed.
+"""
+
+import argparse
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+ME = {"gid": "1000", "name": "Bench User"}
+
+_WORDS = ("fix", "review", "deploy", "write", "plan", "test", "design", "update")
+_THINGS = ("login page", "release notes", "API docs", "billing", "search", "onboarding")
+
+
+def _label(i: int) -> str:
+    """
+    Spells out i in letters (a, b, ..., z, ba, bb, ...), as the config wizard derives config keys
+    from team and board names using letters alone.
+    """
+    label = ""
+    while True:
+        i, r = divmod(i, 26)
+        label = chr(ord("a") + r) + label
+        if i == 0:
+            return label
+
+
+class StubData:
+    """
+    Synthetic Asana resources, generated up front from the given sizes. Tasks are spread evenly
+    over the sections of each project, and every `assigned_every`th task is assigned to the user.
+    """
+
+    def __init__(
+        self,
+        *,
+        workspaces: int = 1,
+        teams: int = 3,
+        projects: int = 4,
+        sections: int = 5,
+        tasks: int = 200,
+        assigned_every: int = 10,
+    ):
+        gids = (str(gid) for gid in itertools.count(1200000000000000))
+        created_at = itertools.count(1_600_000_000)
+
+        self.workspaces: List[Dict] = []
+        self.teams_by_workspace: Dict[str, List[Dict]] = {}
+        self.projects_by_team: Dict[str, List[Dict]] = {}
+        self.sections_by_project: Dict[str, List[Dict]] = {}
+        self.tasks_by_project: Dict[str, List[Dict]] = {}
+        self.tasks_by_section: Dict[str, List[Dict]] = {}
+        self.tasks_by_workspace: Dict[str, List[Dict]] = {}
+        self.tasks: Dict[str, Dict] = {}
+
+        for w in range(workspaces):
+            workspace = {"gid": next(gids), "name": f"Workspace {w}"}
+            self.workspaces.append(workspace)
+            self.teams_by_workspace[workspace["gid"]] = []
+            self.tasks_by_workspace[workspace["gid"]] = []
+
+            for t in range(teams):
+                team = {
+                    "gid": next(gids),
+                    "name": f"Team {_label(w)} {_label(t)}",
+                    "permalink_url": "https://app.asana.com/0/team",
+                }
+                self.teams_by_workspace[workspace["gid"]].append(team)
+                self.projects_by_team[team["gid"]] = []
+
+                for p in range(projects):
+                    project = {
+                        "gid": next(gids),
+                        "name": f"Board {_label(w)} {_label(t)} {_label(p)}",
+                    }
+                    project["permalink_url"] = f"https://app.asana.com/0/{project['gid']}"
+                    self.projects_by_team[team["gid"]].append(project)
+                    project_sections = [
+                        {"gid": next(gids), "name": f"Column {s}"} for s in range(sections)
+                    ]
+                    self.sections_by_project[project["gid"]] = project_sections
+                    self.tasks_by_project[project["gid"]] = []
+
+                    for i in range(tasks):
+                        gid = next(gids)
+                        section = project_sections[i * sections // tasks]
+                        task = {
+                            "gid": gid,
+                            "name": f"{_WORDS[i % len(_WORDS)]} {_THINGS[i % len(_THINGS)]} {i}",
+                            "permalink_url": f"https://app.asana.com/0/{project['gid']}/{gid}",
+                            "assignee": ME if i % assigned_every == 0 else None,
+                            "memberships": [{"section": section}],
+                            "projects": [{"gid": project["gid"], "name": project["name"]}],
+                            "workspace": workspace,
+                            "completed": False,
+                            "created_at": time.strftime(
+                                "%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(next(created_at))
+                            ),
+                        }
+                        self.tasks[gid] = task
+                        self.tasks_by_project[project["gid"]].append(task)
+                        self.tasks_by_section.setdefault(section["gid"], []).append(task)
+                        self.tasks_by_workspace[workspace["gid"]].append(task)
+
+    def my_tasks(self, workspace_id: str) -> List[Dict]:
+        return [t for t in self.tasks_by_workspace.get(workspace_id, []) if t["assignee"] == ME]
+
+    def search(self, workspace_id: str, query: Dict[str, str]) -> List[Dict]:
+        words = query.get("text", "").lower().split()
+        project_id = query.get("projects.any")
+        before = query.get("created_at.before")
+
+        matches = [
+            t
+            for t in self.tasks_by_workspace.get(workspace_id, [])
+            if all(w in t["name"].lower() for w in words)
+            and (project_id is None or any(p["gid"] == project_id for p in t["projects"]))
+            and (before is None or t["created_at"] < before)
+        ]
+        matches.sort(key=lambda t: t["created_at"], reverse=True)
+
+        return matches[: int(query.get("limit", 100))]
+
+
+class StubServer:
+    """
+    Serves StubData over HTTP on localhost from a background thread. Use as a context manager.
+    """
+
+    def __init__(self, data: StubData, *, port: int = 0, latency: float = 0.0):
+        self.data = data
+        self.latency = latency
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._sync_tokens = itertools.count()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def record(self, sent: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += sent
+
+    def new_sync_token(self) -> str:
+        return f"sync-{next(self._sync_tokens)}"
+
+    def respond(self, path: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        """
+        Returns the status code and body of the response to a GET request, with only the fields
+        asked for in opt_fields (if given).
+        """
+        status, body = self._route(path, query)
+
+        if status == 200 and (opt_fields := query.get("opt_fields")):
+            fields = [field.split(".") for field in opt_fields.split(",")]
+            body = {**body, "data": _project(body["data"], fields)}
+
+        return status, body
+
+    def _route(self, path: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        data = self.data
+
+        if path == "/users/me":
+            photo = {
+                f"image_{n}x{n}": f"https://example.com/{n}.png" for n in (21, 27, 36, 60, 128)
+            }
+            return 200, {"data": {**ME, "email": "bench@example.com", "photo": photo}}
+        if path == "/users/me/workspace_memberships":
+            return _page(
+                [{"gid": f"wm-{w['gid']}", "user": ME, "workspace": w} for w in data.workspaces],
+                query,
+            )
+        if path == "/users/me/teams":
+            return _page(data.teams_by_workspace.get(query.get("workspace", ""), []), query)
+        if path == "/users/me/user_task_list":
+            workspace_id = query.get("workspace", "")
+            workspace = next((w for w in data.workspaces if w["gid"] == workspace_id), None)
+            if workspace is None:
+                return 404, {"errors": [{"message": "workspace: Unknown object"}]}
+            return 200, {
+                "data": {
+                    "gid": f"tl-{workspace_id}",
+                    "name": "My Tasks",
+                    "owner": ME,
+                    "workspace": workspace,
+                }
+            }
+        if path == "/events":
+            if not query.get("sync", "").startswith("sync-"):
+                return 412, {
+                    "errors": [{"message": "Sync token invalid or too old."}],
+                    "sync": self.new_sync_token(),
+                }
+            return 200, {"data": [], "sync": query["sync"], "has_more": False}
+
+        if m := re.fullmatch(r"/teams/(\w+)/team_memberships", path):
+            team = {"gid": m[1], "name": ""}
+            return _page([{"gid": f"tm-{m[1]}", "user": ME, "team": team}], query)
+        if m := re.fullmatch(r"/teams/(\w+)/projects", path):
+            return _page(data.projects_by_team.get(m[1], []), query)
+        if m := re.fullmatch(r"/projects/(\w+)/sections", path):
+            return _page(data.sections_by_project.get(m[1], []), query)
+        if m := re.fullmatch(r"/projects/(\w+)/tasks", path):
+            return _page(data.tasks_by_project.get(m[1], []), query)
+        if m := re.fullmatch(r"/sections/(\w+)/tasks", path):
+            return _page(data.tasks_by_section.get(m[1], []), query)
+        if m := re.fullmatch(r"/user_task_lists/tl-(\w+)/tasks", path):
+            return _page(data.my_tasks(m[1]), query)
+        if m := re.fullmatch(r"/workspaces/(\w+)/tasks/search", path):
+            return 200, {"data": data.search(m[1], query)}
+        if (m := re.fullmatch(r"/tasks/(\w+)", path)) and m[1] in data.tasks:
+            return 200, {"data": data.tasks[m[1]]}
+
+        return 404, {"errors": [{"message": f"Not found: {path}"}]}
+
+    def respond_batch(self, actions: List[Dict]) -> Tuple[int, Any]:
+        """
+        Returns the status code and body of the response to a Batch API request of GET actions.
+        """
+        if len(actions) > 10:
+            return 400, {"errors": [{"message": "Too many actions in batch: max 10"}]}
+
+        responses = []
+        for action in actions:
+            url = urlparse(action["relative_path"])
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            query.update({k: str(v) for k, v in action.get("data", {}).items()})
+            query.update(
+                {
+                    k: str(v)
+                    for k, v in action.get("options", {}).items()
+                    if k in ("limit", "offset")
+                }
+            )
+            if fields := action.get("options", {}).get("fields"):
+                query["opt_fields"] = ",".join(fields)
+            status, body = self.respond(url.path, query)
+            responses.append({"status_code": status, "headers": {}, "body": body})
+
+        return 200, {"data": responses}
+
+
+def _project(value: Any, fields: List[List[str]]) -> Any:
+    """
+    Keeps only the given fields (as paths, e.g. ["assignee", "name"]) of a resource or list of
+    resources, along with their gids, as the API does for opt_fields. As with the API, a nested
+    resource asked for without any of its fields (e.g. "assignee") is given as just its gid.
+    """
+    if isinstance(value, list):
+        return [_project(v, fields) for v in value]
+    if not isinstance(value, dict):
+        return value
+
+    projected = {"gid": value["gid"]} if "gid" in value else {}
+    for name in dict.fromkeys(path[0] for path in fields):
+        if name in value:
+            nested = [path[1:] for path in fields if path[0] == name and len(path) > 1]
+            projected[name] = _project(value[name], nested)
+
+    return projected
+
+
+def _page(items: List[Dict], query: Dict[str, str]) -> Tuple[int, Any]:
+    limit = min(int(query.get("limit", 100)), 100)
+    offset = int(query.get("offset", 0))
+    has_more = offset + limit < len(items)
+
+    return 200, {
+        "data": items[offset : offset + limit],
+        "next_page": {"offset": str(offset + limit)} if has_more else None,
+    }
+
+
+def _make_handler(server: StubServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Otherwise the body, being written separately from the headers, is held back by Nagle's
+        # algorithm until the client acknowledges the headers (which it may delay by up to 40ms)
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            path = url.path.removeprefix("/api/1.0")
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+            if server.latency:
+                time.sleep(server.latency)
+
+            status, body = server.respond(path, query)
+            self._send(status, json.dumps(body).encode())
+
+        def do_POST(self):
+            path = urlparse(self.path).path.removeprefix("/api/1.0")
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+            if server.latency:
+                time.sleep(server.latency)
+
+            if path == "/batch":
+                status, body = server.respond_batch(payload["data"]["actions"])
+            else:
+                status, body = 404, {"errors": [{"message": f"Not found: {path}"}]}
+            self._send(status, json.dumps(body).encode())
+
+        def _send(self, status: int, body: bytes):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            server.record(len(body))
+
+    return Handler
+
+
+def add_size_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--workspaces", type=int, default=1, help="Number of workspaces")
+    parser.add_argument("--teams", type=int, default=3, help="Teams per workspace")
+    parser.add_argument("--projects", type=int, default=4, help="Projects (boards) per team")
+    parser.add_argument("--sections", type=int, default=5, help="Sections per project")
+    parser.add_argument("--tasks", type=int, default=200, help="Incomplete tasks per project")
+    parser.add_argument(
+        "--latency-ms", type=float, default=50, help="Delay added to every response"
+    )
+
+
+def data_from_args(args: argparse.Namespace) -> StubData:
+    return StubData(
+        workspaces=args.workspaces,
+        teams=args.teams,
+        projects=args.projects,
+        sections=args.sections,
+        tasks=args.tasks,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a stand-in for the Asana API")
+    parser.add_argument("--port", type=int, default=8080)
+    add_size_arguments(parser)
+    args = parser.parse_args()
+
+    with StubServer(data_from_args(args), port=args.port, latency=args.latency_ms / 1000) as server:
+        print(f"Serving on {server.url} - run asa with ASANA_API_BASE={server.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
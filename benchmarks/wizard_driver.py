@@ -0,0 +1,38 @@
+"""
+Runs asa with questionary's prompts answered automatically, so that the config wizard
+(`asa config --init`) can be run unattended: each select prompt takes its default (or first)
+choice and each checkbox prompt takes every choice.
+
+Usage: python benchmarks/wizard_driver.py config --init
+"""
+
+import sys
+from typing import Any, List
+
+import questionary
+
+
+class _Answer:
+    def __init__(self, value: Any):
+        self.value = value
+
+    def ask(self) -> Any:
+        return self.value
+
+
+def _select(message: str, choices: List[questionary.Choice], default=None, **kwargs) -> _Answer:
+    return _Answer((default or choices[0]).value)
+
+
+def _checkbox(message: str, choices: List[questionary.Choice], **kwargs) -> _Answer:
+    return _Answer([c.value for c in choices])
+
+
+questionary.select = _select  # type: ignore[assignment]
+questionary.checkbox = _checkbox  # type: ignore[assignment]
+
+if __name__ == "__main__":
+    from asa.cli import execute_cli
+
+    sys.argv = ["asa", *sys.argv[1:]]
+    execute_cli()
@@ -0,0 +1,81 @@
+"""
+Checks that asa starts quickly, as it is run from shell prompts and editor integrations.
+
+For each of a set of commands that never talk to Asana, asserts that none of the heavy
+dependencies are imported and that the time spent importing asa (and whatever it imports beyond a
+bare interpreter) stays within budget.
+
+Usage: python scripts/check_startup.py [--budget-ms MILLISECONDS] [--runs RUNS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# Dependencies that must only be imported by the commands that need them
+HEAVY_MODULES = ("pydantic", "requests", "questionary", "httpx", "sqlite3")
+
+COMMANDS = (["--help"], ["board", "--help"], ["config"])
+
+# Budget for the time spent importing modules on top of those imported by a bare interpreter
+DEFAULT_BUDGET_MS = 30
+
+
+def _import_times(python_args: list[str], *, home: str) -> dict[str, int]:
+    """
+    Runs python with the given arguments under `-X importtime`, returning the time spent importing
+    each module (excluding its own imports) in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *python_args],
+        env={**os.environ, "HOME": home},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        # e.g. "import time:       427 |     573989 | asa.cli"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        import_times[module.strip()] = int(self_us)
+
+    return import_times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command; the fastest counts")
+    args = parser.parse_args()
+
+    failed = False
+
+    with tempfile.TemporaryDirectory() as home:
+        baseline = _import_times(["-c", "pass"], home=home).keys()
+
+        for command in COMMANDS:
+            runs = [_import_times(["-m", "asa", *command], home=home) for _ in range(args.runs)]
+            import_ms = min(
+                sum(us for m, us in run.items() if m not in baseline) / 1000 for run in runs
+            )
+            heavy = sorted(m for m in runs[0] if m in HEAVY_MODULES)
+
+            ok = import_ms <= args.budget_ms and not heavy
+            failed = failed or not ok
+
+            print(
+                f"{'ok  ' if ok else 'FAIL'} asa {' '.join(command)}: {import_ms:.1f}ms imports"
+                f" (budget {args.budget_ms:.0f}ms)"
+                + (f", imports heavy modules: {', '.join(heavy)}" if heavy else "")
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())